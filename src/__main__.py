@@ -0,0 +1,37 @@
+"""Runs a single day's puzzle, or one part of it.
+
+Usage:
+    python src DAY [PART]
+    python -m src DAY [PART]
+"""
+import os
+import sys
+
+if __package__:
+    # When run with `-m src`, the day modules' top-level imports need `src` itself on the path
+    sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import solvers  # noqa: E402
+
+
+def main(argv=None):
+    # Arguments are parsed by hand rather than with argparse, which takes longer to import than most days take to run
+    argv = sys.argv[1:] if argv is None else argv
+    try:
+        day = int(argv[0])
+        part = int(argv[1]) if len(argv) > 1 else None
+        if len(argv) > 2:
+            raise ValueError
+    except (IndexError, ValueError):
+        sys.exit(__doc__.strip())
+
+    try:
+        solver = solvers.solver(day, part)
+    except ValueError as error:
+        sys.exit(str(error))
+
+    solver()
+
+
+if __name__ == '__main__':
+    main()
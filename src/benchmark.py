@@ -0,0 +1,256 @@
+import argparse
+import contextlib
+import io
+import json
+import statistics
+import sys
+import time
+import tracemalloc
+
+import solvers
+
+
+def discover_parts(days=None):
+    """Finds every puzzle part implemented by the day modules.
+
+    Days are those registered in `solvers.DAYS`, and their parts are determined by `solvers.parts`.
+
+    Args:
+        days: An optional collection of day numbers to restrict discovery to.
+
+    Returns:
+        A list of (day number, part name, function) tuples, ordered by day and then by part.
+    """
+
+    parts = []
+    for day in sorted(solvers.DAYS):
+        if days is not None and day not in days:
+            continue
+
+        module = solvers.load(day)
+        parts.extend((day, name, getattr(module, name)) for name in solvers.parts(day))
+
+    return parts
+
+
+def measure(function, repeat=5, warmup=1):
+    """Runs a function several times and reports how long it took and how much memory it used.
+
+    Anything the function prints is discarded. Timings are taken without memory tracing enabled; peak memory is
+    measured in one additional traced run, since tracing slows execution considerably.
+
+    Args:
+        function: The callable to measure. It is called with no arguments.
+        repeat: The number of timed runs.
+        warmup: The number of untimed runs made before timing begins.
+
+    Returns:
+        A dictionary containing wall and CPU times in seconds (min, mean and max over the timed runs) and the peak
+        memory in bytes allocated during a run.
+
+    Raises:
+        ValueError: A non-positive value was provided for `repeat`.
+    """
+
+    if repeat < 1:
+        raise ValueError(f"At least one timed run is required. Received {repeat}.")
+
+    wall_times = []
+    cpu_times = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(warmup):
+            function()
+
+        for _ in range(repeat):
+            wall_start = time.perf_counter()
+            cpu_start = time.process_time()
+            function()
+            cpu_times.append(time.process_time() - cpu_start)
+            wall_times.append(time.perf_counter() - wall_start)
+
+        tracemalloc.start()
+        try:
+            function()
+            _, peak_memory = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+    return {
+        "wall_min": min(wall_times),
+        "wall_mean": statistics.mean(wall_times),
+        "wall_max": max(wall_times),
+        "cpu_mean": statistics.mean(cpu_times),
+        "peak_memory": peak_memory,
+    }
+
+
+def run(days=None, repeat=5, warmup=1):
+    """Measures every discovered part, returning a list of result dictionaries."""
+
+    results = []
+    for day, part, function in discover_parts(days):
+        result = {"day": day, "part": part}
+        result.update(measure(function, repeat=repeat, warmup=warmup))
+        results.append(result)
+
+    return results
+
+
+def _build_wire_segments(count):
+    import systems
+
+    return [systems.WireSegment((i, 0), (i, 1 + i % 7)) for i in range(count)]
+
+
+def _build_wire(count):
+    import systems
+
+    wire = systems.Wire()
+    for i in range(count):
+        wire.add_segment(f"{'U' if i % 2 else 'R'}{1 + i % 50}")
+
+    return wire
+
+
+def _build_modules(count):
+    import spacecraft
+
+    return [spacecraft.Module(100000 + i % 100000) for i in range(count)]
+
+
+def _build_intcode_memory(count):
+    # Values spread over a realistic range, so most cells hold their own int object as real programs' do
+    return [(i * 7919) % 2000000 - 1000000 for i in range(count)]
+
+
+def _build_typed_intcode_memory(count):
+    import intcode_memory
+
+    return intcode_memory.TypedMemory(_build_intcode_memory(count))
+
+
+# Each entry maps a name to the function building the structure, how many items to build relative to the scale,
+# and the maximum number of bytes allowed per item before the footprint is considered a regression
+MEMORY_BENCHMARKS = {
+    "wire_segment": (_build_wire_segments, 1, 400),
+    "wire_turn": (_build_wire, 1, 440),
+    "module": (_build_modules, 10, 300),
+    "intcode_cell": (_build_intcode_memory, 1, 48),
+    "intcode_typed": (_build_typed_intcode_memory, 1, 10),
+}
+
+
+def measure_footprint(build, count):
+    """Returns the average number of bytes allocated per item by building a structure of `count` items.
+
+    Args:
+        build: A callable accepting a number of items and returning a structure containing that many items.
+        The structure is kept alive until measurement is complete.
+        count: The number of items to build.
+    """
+
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        structure = build(count)
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+    del structure
+
+    return (after - before) / count
+
+
+def run_memory(scale=1000000, names=None):
+    """Measures the memory footprint of each of the core data structures.
+
+    Args:
+        scale: The number of items to build for each structure, multiplied by the structure's own scale factor.
+        names: An optional collection of names from `MEMORY_BENCHMARKS` to restrict measurement to.
+
+    Returns:
+        A list of result dictionaries, each indicating whether the footprint is within its threshold.
+    """
+
+    results = []
+    for name, (build, factor, threshold) in MEMORY_BENCHMARKS.items():
+        if names is not None and name not in names:
+            continue
+
+        count = scale * factor
+        bytes_per_item = measure_footprint(build, count)
+        results.append({
+            "name": name,
+            "count": count,
+            "bytes_per_item": bytes_per_item,
+            "threshold": threshold,
+            "within_threshold": bytes_per_item <= threshold,
+        })
+
+    return results
+
+
+def format_memory_table(results):
+    """Returns a string containing the memory benchmark results formatted as a plain text table."""
+
+    header = f"{'structure':<14} {'count':>10} {'bytes/item':>11} {'threshold':>10}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result['name']:<14} {result['count']:>10} {result['bytes_per_item']:>11.1f} "
+            f"{result['threshold']:>10}{'' if result['within_threshold'] else '  REGRESSION'}"
+        )
+
+    return "\n".join(lines)
+
+
+def format_table(results):
+    """Returns a string containing the benchmark results formatted as a plain text table."""
+
+    header = f"{'day':>4} {'part':<6} {'wall min':>11} {'wall mean':>11} {'wall max':>11} {'cpu mean':>11} {'peak mem':>12}"
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result['day']:>4} {result['part']:<6} "
+            f"{result['wall_min'] * 1000:>9.3f}ms {result['wall_mean'] * 1000:>9.3f}ms "
+            f"{result['wall_max'] * 1000:>9.3f}ms {result['cpu_mean'] * 1000:>9.3f}ms "
+            f"{result['peak_memory'] / 1024:>10.1f}KiB"
+        )
+
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    """Runs the benchmarks from the command line."""
+
+    parser = argparse.ArgumentParser(description="Benchmark every part of every day's puzzle.")
+    parser.add_argument("days", nargs="*", type=int, help="Only benchmark these days (default: all days)")
+    parser.add_argument("-n", "--repeat", type=int, default=5, help="Number of timed runs per part")
+    parser.add_argument("-w", "--warmup", type=int, default=1, help="Number of untimed warmup runs per part")
+    parser.add_argument("-f", "--format", choices=("table", "json"), default="table", help="Output format")
+    parser.add_argument(
+        "-m", "--memory", action="store_true",
+        help="Measure the memory footprint of the core data structures instead of timing each day"
+    )
+    parser.add_argument("-s", "--scale", type=int, default=1000000, help="Number of items per memory benchmark")
+    args = parser.parse_args(argv)
+
+    if args.memory:
+        results = run_memory(scale=args.scale)
+        print(json.dumps(results, indent=2) if args.format == "json" else format_memory_table(results))
+        if not all(result["within_threshold"] for result in results):
+            sys.exit(1)
+
+        return
+
+    results = run(days=set(args.days) or None, repeat=args.repeat, warmup=args.warmup)
+
+    if args.format == "json":
+        print(json.dumps(results, indent=2))
+    else:
+        print(format_table(results))
+
+
+if __name__ == '__main__':
+    main()
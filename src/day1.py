@@ -1,45 +1,55 @@
-import os
-
+import puzzle_inputs
 import spacecraft
 
 
-def part2():
-    """Processes part 2 of the puzzle for day 1."""
+class SolverContext(object):
+    """Lazily builds and memoizes the intermediate results shared by both parts of the puzzle for day 1."""
+
+    def __init__(self):
+        self._modules = None
+        self._ship = None
+
+    @property
+    def modules(self):
+        """Returns a list of Module instances, one for each mass listed in the input file."""
+
+        if self._modules is None:
+            self._modules = [spacecraft.Module(mass) for mass in puzzle_inputs.load_ints("ship_modules.txt")]
 
-    with open(
-            os.path.join("inputs", "ship_modules.txt"),
-            "rt"
-    ) as in_file:
-        inputs = in_file.readlines()
+        return self._modules
 
-    ship = spacecraft.Spacecraft()
+    @property
+    def ship(self):
+        """Returns a Spacecraft instance consisting of every module listed in the input file."""
 
-    for input_ in inputs:
-        ship.add_module(spacecraft.Module(int(input_.strip())))
+        if self._ship is None:
+            self._ship = spacecraft.Spacecraft(modules=self.modules)
+
+        return self._ship
+
+
+def part2(context=None):
+    """Processes part 2 of the puzzle for day 1."""
 
-    print(ship.fuel_requirement)
+    context = context or SolverContext()
+    print(context.ship.fuel_requirement)
 
 
-def part1():
+def part1(context=None):
     """Processes part 1 of the puzzle for day 1."""
 
+    context = context or SolverContext()
     total_fuel = 0
-    with open(
-            os.path.join("inputs", "ship_modules.txt"),
-            "rt"
-    ) as in_file:
-        inputs = in_file.readlines()
-
-    for input_ in inputs:
-        my_module = spacecraft.Module(int(input_.strip()))
+    for my_module in context.modules:
         total_fuel += my_module.matter_fuel_requirement
 
     print(total_fuel)
 
 
 def main():
-    part1()
-    part2()
+    context = SolverContext()
+    part1(context)
+    part2(context)
 
 
 if __name__ == "__main__":
@@ -1,20 +1,33 @@
-import os
-
+import puzzle_inputs
 import spacecraft
 
 
 def get_inputs():
     """Returns a list of integers representing the instructions to be processed."""
 
-    with open(os.path.join("inputs", "intcode_inputs.txt"), "rt") as in_file:
-        inputs = in_file.read().strip().split(',')
+    return puzzle_inputs.load_ints("intcode_inputs.txt")
+
+
+class SolverContext(object):
+    """Lazily builds and memoizes the intermediate results shared by both parts of the puzzle for day 2."""
+
+    def __init__(self):
+        self._program = None
 
-    return [int(input_) for input_ in inputs]
+    @property
+    def program(self):
+        """Returns the unmodified intcode program. Callers must copy it before running it."""
 
+        if self._program is None:
+            self._program = get_inputs()
 
-def part2():
+        return self._program
+
+
+def part2(context=None):
     """Processes part 2 of the puzzle for day 2."""
-    orig_inputs = get_inputs()
+    context = context or SolverContext()
+    orig_inputs = context.program
     target_value = 19690720
     for noun in range(0, 100):
         for verb in range(0, 100):
@@ -28,16 +41,22 @@ def part2():
                 break
 
 
-def part1():
+def part1(context=None):
     """Processes part 1 of the puzzle for day 2."""
 
-    inputs = get_inputs()
+    context = context or SolverContext()
+    inputs = context.program.copy()
     computer = spacecraft.Computer()
     inputs[1] = 12
     inputs[2] = 2
     print(computer.intcode(inputs)[0])
 
 
+def main():
+    context = SolverContext()
+    part1(context)
+    part2(context)
+
+
 if __name__ == '__main__':
-    part1()
-    part2()
+    main()
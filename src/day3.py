@@ -1,22 +1,18 @@
-import os
-
+import puzzle_inputs
 import systems
 
 
 def get_inputs():
-    """Returns a list of strings read in from the input file."""
-
-    with open(os.path.abspath(os.path.join("..", "inputs", "wire_paths.txt")), "rt") as in_file:
-        inputs = in_file.readlines()
+    """Returns a list containing, for each wire in the input file, a list of (x, y) offsets describing its path."""
 
-    return inputs
+    return puzzle_inputs.load_wire_offsets("wire_paths.txt")
 
 
 def construct_circuit(wire_instructions):
     """Creates and returns a FuelManagement instance with the provided wire instructions.
 
     Args:
-        wire_instructions: A list of strings indicating the directions from which to create
+        wire_instructions: A list of strings or lists indicating the directions from which to create
         the FuelManagement object's wires.
 
     Returns:
@@ -30,23 +26,44 @@ def construct_circuit(wire_instructions):
     return fm
 
 
-def part1():
+class SolverContext(object):
+    """Lazily builds and memoizes the intermediate results shared by both parts of the puzzle for day 3.
+
+    Both parts work from the same circuit, and the circuit itself caches its intersections, so sharing a context
+    between the parts means the wires are only built and intersected once.
+    """
+
+    def __init__(self):
+        self._circuit = None
+
+    @property
+    def circuit(self):
+        """Returns a FuelManagement instance with wires built from the input file."""
+
+        if self._circuit is None:
+            self._circuit = construct_circuit(get_inputs())
+
+        return self._circuit
+
+
+def part1(context=None):
     """Processes part 1 of the puzzle for day 3."""
 
-    fm = construct_circuit(get_inputs())
-    print(fm.get_distance_to_closest_intersection())
+    context = context or SolverContext()
+    print(context.circuit.get_distance_to_closest_intersection())
 
 
-def part2():
+def part2(context=None):
     """Processes part 2 of the puzzle for day 3."""
 
-    fm = construct_circuit(get_inputs())
-    print(fm.get_lowest_latency_intersection())
+    context = context or SolverContext()
+    print(context.circuit.get_lowest_latency_intersection())
 
 
 def main():
-    part1()
-    part2()
+    context = SolverContext()
+    part1(context)
+    part2(context)
 
 
 if __name__ == '__main__':
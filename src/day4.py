@@ -2,6 +2,127 @@ RANGE_MIN = 183564
 RANGE_MAX = 657474
 
 
+def candidate_passwords(range_min=RANGE_MIN, range_max=RANGE_MAX):
+    """Generates every integer in a range whose digits never decrease from left to right.
+
+    Only passwords with non-decreasing digits can meet either set of criteria, so enumerating them directly skips
+    the vast majority of the range. Digits are chosen one at a time, and any prefix whose possible completions all
+    fall outside the range is pruned, so the cost depends on the number of candidates rather than the size of the
+    range.
+
+    Args:
+        range_min: The lowest integer (inclusive) to consider.
+        range_max: The highest integer (exclusive) to consider.
+
+    Yields:
+        Integers with non-decreasing digits in ascending order, where `range_min <= x < range_max`.
+    """
+
+    range_min = max(range_min, 0)
+    if range_max <= range_min:
+        return
+
+    def extend(prefix, last_digit, remaining):
+        if remaining == 0:
+            yield prefix
+            return
+
+        scale = 10 ** remaining
+        for digit in range(last_digit, 10):
+            # The smallest completion repeats `digit`, the largest fills the remaining places with nines
+            lowest = (prefix * 10 + digit) * scale // 10 + digit * ((scale // 10 - 1) // 9)
+            highest = (prefix * 10 + digit + 1) * scale // 10 - 1
+            if highest < range_min:
+                continue
+            if lowest >= range_max:
+                return
+
+            yield from extend(prefix * 10 + digit, digit, remaining - 1)
+
+    for width in range(len(str(range_min)), len(str(range_max - 1)) + 1):
+        # A leading zero is only meaningful for the single digit number 0
+        yield from extend(0, 0 if width == 1 else 1, width)
+
+
+def run_is_pair(run_length):
+    """Returns a boolean indicating whether a run of identical digits contains at least two matching digits."""
+
+    return run_length >= 2
+
+
+def run_is_exact_pair(run_length):
+    """Returns a boolean indicating whether a run of identical digits is exactly two digits long."""
+
+    return run_length == 2
+
+
+class PasswordRules(object):
+    """A composable set of password rules evaluated over the runs of identical digits in a password.
+
+    Digits are peeled off the password with integer arithmetic, from the least significant digit up, and grouped
+    into runs of identical digits as they go. Monotonicity and every run rule are checked in that single pass,
+    without converting the password to a string. Rule sets can be combined with `&`.
+    """
+
+    def __init__(self, *run_rules, non_decreasing=True):
+        """Initializes a new PasswordRules instance.
+
+        Args:
+            run_rules: Any number of callables accepting the length of a run of identical digits and returning
+            a boolean. Each rule must be satisfied by at least one run in the password.
+            non_decreasing: A boolean indicating whether digits must never decrease from left to right.
+        """
+
+        self.run_rules = run_rules
+        self.non_decreasing = non_decreasing
+
+    def __and__(self, other):
+        if not isinstance(other, PasswordRules):
+            return NotImplemented
+
+        return PasswordRules(
+            *(self.run_rules + other.run_rules), non_decreasing=self.non_decreasing or other.non_decreasing
+        )
+
+    def __call__(self, password):
+        """Returns a boolean indicating whether a non-negative integer password satisfies every rule.
+
+        Raises:
+            ValueError: The password is negative.
+        """
+
+        if password < 0:
+            raise ValueError(f"Passwords must be non-negative. Received {password}.")
+
+        run_lengths = set()
+        remaining, right_digit = divmod(password, 10)
+        run_length = 1
+        while remaining:
+            remaining, digit = divmod(remaining, 10)
+            if digit == right_digit:
+                run_length += 1
+                continue
+
+            if digit > right_digit and self.non_decreasing:
+                return False
+
+            run_lengths.add(run_length)
+            right_digit = digit
+            run_length = 1
+
+        run_lengths.add(run_length)
+
+        for rule in self.run_rules:
+            if not any(rule(length) for length in run_lengths):
+                return False
+
+        return True
+
+
+INCOMPLETE_CRITERIA = PasswordRules(run_is_pair)
+CRITERIA = PasswordRules(run_is_exact_pair)
+
+
 def password_meets_incomplete_criteria(password):
     """Checks a password against the incomplete criteria provided (for part 1).
 
@@ -13,21 +134,13 @@ def password_meets_incomplete_criteria(password):
 
     Raises:
         TypeError: The password provided is not of type `int`.
+        ValueError: The password provided is negative.
     """
 
     if not isinstance(password, int):
         raise TypeError(f"Value for password is of invalid type. Requires an integer, but received {type(password)}.")
 
-    pw_string = str(password)
-    has_matching_adjacent = False
-    for a, b in zip(pw_string, pw_string[1:]):
-        if int(b) < int(a):
-            return False
-
-        if a == b:
-            has_matching_adjacent = True
-
-    return has_matching_adjacent
+    return INCOMPLETE_CRITERIA(password)
 
 
 def password_meets_criteria(password):
@@ -41,50 +154,273 @@ def password_meets_criteria(password):
 
     Raises:
         TypeError: The password provided is not of type `int`.
+        ValueError: The password provided is negative.
     """
 
     if not isinstance(password, int):
         raise TypeError(f"Value for password is of invalid type. Requires an integer, but received {type(password)}.")
 
-    pw_string = str(password)
-    has_matching_adjacent = False
-    matched = None
-    prev_a = None
-    for a, b in zip(pw_string, pw_string[1:]):
-        if int(b) < int(a):
-            return False
+    return CRITERIA(password)
+
+
+def password_mask(passwords, exact_pair=False):
+    """Evaluates the criteria over a whole batch of passwords at once using NumPy.
+
+    Digits are peeled off every password at once with vectorized integer division, from the least significant digit
+    up, and monotonicity, adjacent pairs and runs of exactly two are tracked with array operations as each column of
+    digits is produced. Places to the left of a password's leading digit are ignored.
+
+    Args:
+        passwords: An array-like of non-negative integers (up to 18 digits) representing the passwords to check.
+        exact_pair: A boolean indicating whether the full criteria (`password_meets_criteria`) should be applied
+        rather than the incomplete criteria (`password_meets_incomplete_criteria`).
+
+    Returns:
+        A NumPy array of booleans indicating whether each password meets the criteria.
+    """
+
+    import numpy as np
+
+    remaining = np.array(passwords, dtype=np.int64)
+    non_decreasing = np.ones(remaining.shape, dtype=bool)
+    has_pair = np.zeros(remaining.shape, dtype=bool)
+
+    # Whether the previous two digit pairs (to the right of the current digit) matched
+    pair_right = np.zeros(remaining.shape, dtype=bool)
+    pair_right_right = np.zeros(remaining.shape, dtype=bool)
+
+    remaining, right_digit = np.divmod(remaining, 10)
+    while remaining.any():
+        in_number = remaining > 0
+        remaining, digit = np.divmod(remaining, 10)
+
+        non_decreasing &= ~in_number | (digit <= right_digit)
+        pair = in_number & (digit == right_digit)
+        if exact_pair:
+            has_pair |= pair_right & ~pair_right_right & ~pair
+            pair_right_right = pair_right
+            pair_right = pair
+        else:
+            has_pair |= pair
+
+        right_digit = digit
+
+    if exact_pair:
+        has_pair |= pair_right & ~pair_right_right
+
+    return non_decreasing & has_pair
+
 
-        if a == b and matched is None:
-            has_matching_adjacent = True
-            matched = a
+def count_passwords_vectorized(range_min=RANGE_MIN, range_max=RANGE_MAX, exact_pair=False, chunk_size=1 << 20):
+    """Counts the passwords meeting the criteria within a range using `password_mask`.
 
-        if prev_a is not None and prev_a == b and prev_a == matched:
-            has_matching_adjacent = False
-            matched = None
+    Args:
+        range_min: The lowest integer (inclusive) to consider.
+        range_max: The highest integer (exclusive) to consider.
+        exact_pair: A boolean indicating whether the full criteria should be applied.
+        chunk_size: The number of passwords to evaluate per batch, bounding peak memory use.
+
+    Returns:
+        An integer indicating how many passwords in the range meet the criteria.
+    """
+
+    return sum(
+        int(mask.sum()) for _, mask in _password_mask_chunks(range_min, range_max, exact_pair, chunk_size)
+    )
+
+
+def matching_passwords(range_min=RANGE_MIN, range_max=RANGE_MAX, exact_pair=False, chunk_size=1 << 20):
+    """Returns a NumPy array of every password meeting the criteria within a range, in ascending order.
+
+    Args:
+        range_min: The lowest integer (inclusive) to consider.
+        range_max: The highest integer (exclusive) to consider.
+        exact_pair: A boolean indicating whether the full criteria should be applied.
+        chunk_size: The number of passwords to evaluate per batch, bounding peak memory use.
+    """
+
+    import numpy as np
+
+    matches = [
+        passwords[mask] for passwords, mask in _password_mask_chunks(range_min, range_max, exact_pair, chunk_size)
+    ]
+
+    return np.concatenate(matches) if matches else np.zeros(0, dtype=np.int64)
+
+
+def _password_mask_chunks(range_min, range_max, exact_pair, chunk_size):
+    import numpy as np
+
+    range_min = max(range_min, 0)
+    for chunk_start in range(range_min, range_max, chunk_size):
+        passwords = np.arange(chunk_start, min(chunk_start + chunk_size, range_max), dtype=np.int64)
+        yield passwords, password_mask(passwords, exact_pair=exact_pair)
+
+
+class PasswordAutomaton(object):
+    """A deterministic finite automaton accepting the digits of passwords which meet the criteria.
+
+    The rules checked by `password_meets_incomplete_criteria` and `password_meets_criteria` only ever depend on the
+    previous digit, the length of the current run of identical digits, and whether a qualifying run has been seen
+    yet. Those few values are compiled into a transition table over the digits 0-9, which allows the number of
+    matching passwords in a range to be counted with a digit dynamic-programming pass instead of by enumeration.
+    """
+
+    DEAD = -1
+
+    def __init__(self, exact_pair=False):
+        """Compiles a new PasswordAutomaton.
+
+        Args:
+            exact_pair: A boolean indicating whether a run of exactly two matching digits is required (part 2),
+            rather than a run of at least two (part 1).
+        """
+
+        self.exact_pair = exact_pair
+
+        # Each state is (previous digit, length of the current run capped at 3, qualifying run already seen)
+        start = (None, 0, False)
+        states = [start]
+        self._states = {start: 0}
+        self.transitions = []
+
+        # States are numbered in the order they are discovered, so rows are appended in index order
+        for state in states:
+            row = []
+            for digit in range(10):
+                next_state = self._step(state, digit)
+                if next_state is None:
+                    row.append(self.DEAD)
+                    continue
+
+                if next_state not in self._states:
+                    self._states[next_state] = len(states)
+                    states.append(next_state)
+                row.append(self._states[next_state])
+
+            self.transitions.append(row)
+
+        self.accepting = [False] * len(self._states)
+        for state, index in self._states.items():
+            self.accepting[index] = self._accepts(state)
 
-        prev_a = a
+        self._completions = {}
 
-    return has_matching_adjacent
+    def _run_qualifies(self, run_length):
+        return run_length == 2 if self.exact_pair else run_length >= 2
+
+    def _step(self, state, digit):
+        previous, run_length, seen = state
+        if previous is not None and digit < previous:
+            return None
+
+        if digit == previous:
+            return previous, min(run_length + 1, 3), seen
+
+        return digit, 1, seen or self._run_qualifies(run_length)
+
+    def _accepts(self, state):
+        previous, run_length, seen = state
+        return seen or self._run_qualifies(run_length)
+
+    @property
+    def start(self):
+        """Returns the index of the automaton's initial state."""
+
+        return 0
+
+    def accepts(self, password):
+        """Returns a boolean indicating whether the automaton accepts the digits of a given password.
+
+        Args:
+            password: An integer representing the password to check against the criteria.
+        """
+
+        state = self.start
+        for digit in str(password):
+            state = self.transitions[state][int(digit)]
+            if state == self.DEAD:
+                return False
+
+        return self.accepting[state]
+
+    def _count_completions(self, length):
+        """Returns a list giving, for each state, the number of accepted digit strings of `length` from that state."""
+
+        completions = self._completions.get(length)
+        if completions is None:
+            if length == 0:
+                completions = [1 if accepting else 0 for accepting in self.accepting]
+            else:
+                shorter = self._count_completions(length - 1)
+                completions = [
+                    sum(shorter[next_state] for next_state in row if next_state != self.DEAD)
+                    for row in self.transitions
+                ]
+
+            self._completions[length] = completions
+
+        return completions
+
+    def _count_below(self, bound):
+        """Returns the number of accepted non-negative integers less than `bound`."""
+
+        if bound <= 0:
+            return 0
+
+        digits = [int(digit) for digit in str(bound)]
+        total = 0
+
+        # Every number with fewer digits than the bound is below it
+        for width in range(1, len(digits)):
+            completions = self._count_completions(width - 1)
+            first_digits = range(10) if width == 1 else range(1, 10)
+            for digit in first_digits:
+                next_state = self.transitions[self.start][digit]
+                if next_state != self.DEAD:
+                    total += completions[next_state]
+
+        # Numbers with the same number of digits share a prefix with the bound, then drop below it at some position
+        state = self.start
+        for position, bound_digit in enumerate(digits):
+            completions = self._count_completions(len(digits) - position - 1)
+            lowest = 1 if position == 0 and len(digits) > 1 else 0
+            for digit in range(lowest, bound_digit):
+                next_state = self.transitions[state][digit]
+                if next_state != self.DEAD:
+                    total += completions[next_state]
+
+            state = self.transitions[state][bound_digit]
+            if state == self.DEAD:
+                break
+
+        return total
+
+    def count(self, range_min=RANGE_MIN, range_max=RANGE_MAX):
+        """Counts the passwords meeting the criteria within a range without enumerating them.
+
+        Args:
+            range_min: The lowest integer (inclusive) to consider.
+            range_max: The highest integer (exclusive) to consider.
+
+        Returns:
+            An integer indicating how many passwords in the range meet the criteria.
+        """
+
+        if range_max <= range_min:
+            return 0
+
+        return self._count_below(range_max) - self._count_below(max(range_min, 0))
 
 
 def part1():
     """Processes part 1 of the puzzle for day 4."""
-    num_possibilities = 0
-    for x in range(RANGE_MIN, RANGE_MAX):
-        if password_meets_incomplete_criteria(x):
-            num_possibilities += 1
-
-    print(num_possibilities)
+    print(PasswordAutomaton().count(RANGE_MIN, RANGE_MAX))
 
 
 def part2():
     """Processes part 2 of the puzzle for day 4."""
-    num_possibilities = 0
-    for x in range(RANGE_MIN, RANGE_MAX):
-        if password_meets_criteria(x):
-            num_possibilities += 1
-
-    print(num_possibilities)
+    print(PasswordAutomaton(exact_pair=True).count(RANGE_MIN, RANGE_MAX))
 
 
 def main():
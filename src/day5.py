@@ -1,24 +1,59 @@
-import os
-
+import puzzle_inputs
 import spacecraft
 
 
 def get_inputs():
     """Returns a list of integers representing the instructions to be processed."""
 
-    with open(os.path.abspath(os.path.join("..", "inputs", "day5_inputs.txt")), "rt") as in_file:
-        inputs = in_file.read().strip().split(',')
+    return puzzle_inputs.load_ints("day5_inputs.txt")
+
+
+class SolverContext(object):
+    """Lazily builds and memoizes the intermediate results shared by both parts of the puzzle for day 5."""
+
+    def __init__(self):
+        self._program = None
+
+    @property
+    def program(self):
+        """Returns the unmodified diagnostic program. Callers must copy it before running it."""
+
+        if self._program is None:
+            self._program = get_inputs()
+
+        return self._program
+
+
+def run_diagnostic(system_id, context=None):
+    """Runs the diagnostic program for a given system ID, returning the list of values it outputs."""
+
+    context = context or SolverContext()
+    outputs = []
+    spacecraft.Computer().intcode(context.program.copy(), input_values=[system_id], outputs=outputs)
+
+    return outputs
+
+
+def part1(context=None):
+    """Processes part 1 of the puzzle for day 5."""
+
+    # The air conditioner unit has system ID 1; the final output is the diagnostic code
+    print(run_diagnostic(1, context)[-1])
+
+
+def part2(context=None):
+    """Processes part 2 of the puzzle for day 5."""
 
-    return [int(input_) for input_ in inputs]
+    # The thermal radiator controller has system ID 5
+    print(run_diagnostic(5, context)[-1])
 
 
 def main():
     """Processes the challenge for day 5."""
 
-    # When prompted, input for part 1 must be `1`, input for part 2 must be `5`
-    inputs = get_inputs()
-    computer = spacecraft.Computer()
-    computer.intcode(inputs)
+    context = SolverContext()
+    part1(context)
+    part2(context)
 
 
 if __name__ == '__main__':
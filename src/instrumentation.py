@@ -0,0 +1,184 @@
+import contextlib
+import sys
+import time
+
+# Checked by instrumented code before doing any work, so disabled instrumentation costs a single attribute lookup
+enabled = False
+
+_counters = {}
+_maximums = {}
+_timers = {}
+_depths = {}
+
+
+def enable():
+    """Turns instrumentation on. Previously collected values are kept."""
+
+    global enabled
+    enabled = True
+
+
+def disable():
+    """Turns instrumentation off. Previously collected values are kept."""
+
+    global enabled
+    enabled = False
+
+
+def reset():
+    """Discards every collected value."""
+
+    _counters.clear()
+    _maximums.clear()
+    _timers.clear()
+    _depths.clear()
+
+
+def increment(name, amount=1):
+    """Adds to a named counter, such as the number of times a hot path has been hit.
+
+    Args:
+        name: The name of the counter.
+        amount: The amount to add to the counter.
+    """
+
+    if enabled:
+        _counters[name] = _counters.get(name, 0) + amount
+
+
+def record_max(name, value):
+    """Records a value for a named maximum, keeping only the largest value seen.
+
+    Args:
+        name: The name of the maximum.
+        value: The value to record.
+    """
+
+    if enabled and (name not in _maximums or value > _maximums[name]):
+        _maximums[name] = value
+
+
+@contextlib.contextmanager
+def nested(name):
+    """A context manager tracking how deeply it has been nested, recording the deepest level reached.
+
+    Intended for measuring recursion depth: wrap the recursive call, and the maximum depth is recorded under `name`.
+
+    Args:
+        name: The name under which the maximum depth is recorded.
+    """
+
+    depth = _depths.get(name, 0) + 1
+    _depths[name] = depth
+    record_max(name, depth)
+    try:
+        yield
+    finally:
+        _depths[name] = depth - 1
+
+
+@contextlib.contextmanager
+def _timed(name):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        total, count = _timers.get(name, (0.0, 0))
+        _timers[name] = (total + elapsed, count + 1)
+
+
+def timer(name):
+    """Returns a context manager which adds the time spent within it to a named timer.
+
+    If instrumentation is disabled when the context is entered, nothing is timed.
+
+    Args:
+        name: The name of the timer.
+    """
+
+    return _timed(name) if enabled else contextlib.nullcontext()
+
+
+def snapshot():
+    """Returns a dictionary containing a copy of every value collected so far."""
+
+    return {
+        "counters": dict(_counters),
+        "maximums": dict(_maximums),
+        "timers": {name: {"total": total, "count": count} for name, (total, count) in _timers.items()},
+    }
+
+
+@contextlib.contextmanager
+def collect():
+    """A context manager which enables instrumentation for the duration of a block of code.
+
+    Values are reset on entry. The yielded dictionary is filled with a snapshot of the collected values on exit,
+    and instrumentation is returned to its previous state.
+
+    Example:
+        with instrumentation.collect() as stats:
+            day3.main()
+        print(stats["counters"])
+    """
+
+    global enabled
+    previously_enabled = enabled
+    reset()
+    enabled = True
+    stats = {}
+    try:
+        yield stats
+    finally:
+        enabled = previously_enabled
+        stats.update(snapshot())
+
+
+def format_report(stats=None):
+    """Returns a string containing a snapshot formatted for display in a terminal.
+
+    Args:
+        stats: A snapshot as returned by `snapshot`. Defaults to the current values.
+    """
+
+    stats = stats if stats is not None else snapshot()
+    lines = []
+    for title, values in (("Counters", stats["counters"]), ("Maximums", stats["maximums"])):
+        if values:
+            lines.append(f"{title}:")
+            lines.extend(f"  {name:<40} {value:>14}" for name, value in sorted(values.items()))
+
+    if stats["timers"]:
+        lines.append("Timers:")
+        lines.extend(
+            f"  {name:<40} {timing['total'] * 1000:>12.3f}ms  ({timing['count']} calls)"
+            for name, timing in sorted(stats["timers"].items())
+        )
+
+    return "\n".join(lines)
+
+
+def dump(out_file=None, output_format="table", stats=None):
+    """Writes a snapshot to a file, either as JSON or formatted for display in a terminal.
+
+    Args:
+        out_file: A writable text file. Defaults to standard output.
+        output_format: Either `table` or `json`.
+        stats: A snapshot as returned by `snapshot`. Defaults to the current values.
+
+    Raises:
+        ValueError: An invalid value was provided for `output_format`.
+    """
+
+    stats = stats if stats is not None else snapshot()
+    out_file = out_file or sys.stdout
+    if output_format == "json":
+        import json
+
+        json.dump(stats, out_file, indent=2)
+        out_file.write("\n")
+    elif output_format == "table":
+        out_file.write(format_report(stats) + "\n")
+    else:
+        raise ValueError(f"Invalid output format `{output_format}`. Expected `table` or `json`.")
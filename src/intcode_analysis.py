@@ -0,0 +1,403 @@
+import collections
+
+import instrumentation
+import spacecraft
+
+MNEMONICS = {
+    spacecraft.Computer.ADD: "ADD",
+    spacecraft.Computer.MULT: "MULT",
+    spacecraft.Computer.STORE: "STORE",
+    spacecraft.Computer.OUTPUT: "OUTPUT",
+    spacecraft.Computer.JUMP_IF_TRUE: "JUMP_IF_TRUE",
+    spacecraft.Computer.JUMP_IF_FALSE: "JUMP_IF_FALSE",
+    spacecraft.Computer.LESS_THAN: "LESS_THAN",
+    spacecraft.Computer.EQUALS: "EQUALS",
+    spacecraft.Computer.HALT: "HALT",
+}
+JUMPS = (spacecraft.Computer.JUMP_IF_TRUE, spacecraft.Computer.JUMP_IF_FALSE)
+COMPARISONS = (spacecraft.Computer.LESS_THAN, spacecraft.Computer.EQUALS)
+
+
+class Instruction(collections.namedtuple("Instruction", ("address", "opcode", "modes", "operands"))):
+    """A single decoded intcode instruction.
+
+    Attributes:
+        address: The index in memory at which the instruction starts.
+        opcode: The instruction's op code.
+        modes: A tuple containing the parameter mode of each operand.
+        operands: A tuple containing the raw value of each operand.
+    """
+
+    __slots__ = ()
+
+    @property
+    def size(self):
+        """Returns the number of memory cells the instruction occupies."""
+
+        return len(self.operands) + 1
+
+    @property
+    def jump_target(self):
+        """Returns the target of a jump with an immediate mode target, or None if it can't be determined statically."""
+
+        if self.opcode in JUMPS and self.modes[1] == 1:
+            return self.operands[1]
+
+        return None
+
+    def __str__(self):
+        operands = ", ".join(
+            str(operand) if mode == 1 else f"[{operand}]" for operand, mode in zip(self.operands, self.modes)
+        )
+        return f"{self.address:>6}: {MNEMONICS[self.opcode]:<13} {operands}".rstrip()
+
+
+def decode(program, address):
+    """Decodes the instruction starting at a given address.
+
+    Args:
+        program: A list of integers representing intcode memory.
+        address: The index in memory at which the instruction starts.
+
+    Returns:
+        An Instruction instance.
+
+    Raises:
+        ValueError: The value at the address is not a valid instruction.
+    """
+
+    value = program[address]
+    opcode = value % 100
+    metadata = spacecraft.Computer.VALID_INSTRUCTIONS.get(opcode)
+    if value < 0 or metadata is None:
+        raise ValueError(f"Invalid instruction at {address}")
+
+    parameter_count = metadata.get('parameters', 0)
+    output_param = metadata.get('output_param')
+    modes = tuple(
+        # Output parameters are always addresses, regardless of the mode given
+        0 if i + 1 == output_param else (value // 10 ** (i + 2)) % 10
+        for i in range(parameter_count)
+    )
+
+    return Instruction(address, opcode, modes, tuple(program[address + 1:address + 1 + parameter_count]))
+
+
+def disassemble(program, entry=0):
+    """Disassembles the parts of an intcode program reachable from its entry point.
+
+    Instructions are followed from the entry point through fall-through and statically known (immediate mode) jump
+    targets. Jumps whose targets are read from memory can't be followed, so code only reachable through them is
+    omitted, as is any data following a HALT.
+
+    Args:
+        program: A list of integers representing intcode memory.
+        entry: The address at which execution starts.
+
+    Returns:
+        A list of Instruction instances, ordered by address.
+    """
+
+    instructions = {}
+    pending = [entry]
+    while pending:
+        address = pending.pop()
+        while 0 <= address < len(program) and address not in instructions:
+            try:
+                instruction = decode(program, address)
+            except ValueError:
+                break
+
+            instructions[address] = instruction
+            if instruction.opcode == spacecraft.Computer.HALT:
+                break
+
+            if instruction.jump_target is not None:
+                pending.append(instruction.jump_target)
+
+            address += instruction.size
+
+    return [instructions[address] for address in sorted(instructions)]
+
+
+def basic_blocks(program, entry=0):
+    """Splits the reachable parts of an intcode program into basic blocks.
+
+    A new block starts at the entry point, at every statically known jump target, and after every jump or HALT.
+
+    Args:
+        program: A list of integers representing intcode memory.
+        entry: The address at which execution starts.
+
+    Returns:
+        A list of blocks, each a list of consecutive Instruction instances.
+    """
+
+    instructions = disassemble(program, entry)
+    leaders = {entry}
+    for instruction in instructions:
+        if instruction.jump_target is not None:
+            leaders.add(instruction.jump_target)
+        if instruction.opcode in JUMPS or instruction.opcode == spacecraft.Computer.HALT:
+            leaders.add(instruction.address + instruction.size)
+
+    blocks = []
+    for instruction in instructions:
+        # Disassembly may leave gaps (such as data after a HALT), which also separate blocks
+        follows_previous = blocks and blocks[-1][-1].address + blocks[-1][-1].size == instruction.address
+        if not follows_previous or instruction.address in leaders:
+            blocks.append([])
+        blocks[-1].append(instruction)
+
+    return blocks
+
+
+def count_sequences(program, length=2, entry=0):
+    """Counts how often each sequence of op codes occurs within the basic blocks of an intcode program.
+
+    Args:
+        program: A list of integers representing intcode memory.
+        length: The number of consecutive instructions in each sequence.
+        entry: The address at which execution starts.
+
+    Returns:
+        A Counter mapping tuples of op codes to the number of times they occur.
+    """
+
+    sequences = collections.Counter()
+    for block in basic_blocks(program, entry):
+        opcodes = [instruction.opcode for instruction in block]
+        sequences.update(tuple(opcodes[i:i + length]) for i in range(len(opcodes) - length + 1))
+
+    return sequences
+
+
+def is_compare_and_jump(first, second):
+    """Returns a boolean indicating whether two instructions are a comparison followed by a jump on its result."""
+
+    return (
+        first.opcode in COMPARISONS
+        and second.opcode in JUMPS
+        and second.address == first.address + first.size
+        and second.modes[0] == 0
+        and second.operands[0] == first.operands[2]
+    )
+
+
+def is_add_to_self(instruction):
+    """Returns a boolean indicating whether an instruction adds a constant to the address it writes to."""
+
+    if instruction.opcode != spacecraft.Computer.ADD:
+        return False
+
+    (a, b, output), (mode_a, mode_b, _) = instruction.operands, instruction.modes
+
+    return (mode_a == 0 and a == output and mode_b == 1) or (mode_b == 0 and b == output and mode_a == 1)
+
+
+class CodeModified(Exception):
+    """Raised by fused instructions when a write lands on memory holding decoded instructions."""
+
+    def __init__(self, next_index):
+        super(CodeModified, self).__init__(next_index)
+        self.next_index = next_index
+
+
+class FusedInterpreter(object):
+    """Executes intcode programs using pre-decoded handlers, fusing common instruction pairs into superinstructions.
+
+    Each instruction is decoded once, the first time it is reached, into a handler which reads its operands and
+    writes its result without re-parsing the instruction. Where a comparison is immediately followed by a jump on its
+    result, or a constant is added to an address which is then tested by a jump (a loop counter), both instructions
+    are executed by a single handler. Every address keeps its own handler, so jumps into the middle of a fused pair
+    still behave correctly.
+
+    If the program writes to memory holding an instruction which has already been decoded, the decoded handlers can
+    no longer be trusted, and execution falls back to the unfused interpreter in `Computer.execute`.
+    """
+
+    def __init__(self, computer=None):
+        self.computer = computer or spacecraft.Computer()
+        self.fused_count = 0
+
+    def execute(self, memory, input_values=None, outputs=None):
+        """Executes a program in place until it halts.
+
+        Args:
+            memory: A list of integers representing the intcode program's memory. It is modified in place.
+            input_values: An optional iterator of integers consumed by STORE instructions. If not provided,
+            the user is prompted for each value instead.
+            outputs: An optional list to which values from OUTPUT instructions are appended. If not provided,
+            output values are printed instead.
+
+        Returns:
+            A tuple containing the index at which execution stopped, the number of instructions executed, and
+            a boolean indicating whether the program halted.
+        """
+
+        handlers = {}
+        code = set()
+        index = 0
+        steps = 0
+
+        # Every run counts its own superinstructions, so the count describes the most recent program executed
+        self.fused_count = 0
+        try:
+            while index < len(memory):
+                handler = handlers.get(index)
+                if handler is None:
+                    handler = handlers[index] = self._compile(memory, index, code, input_values, outputs)
+
+                next_index, executed = handler(memory)
+                steps += executed
+                if next_index is None:
+                    instrumentation.increment("computer.steps", steps)
+                    return index, steps, True
+
+                index = next_index
+        except CodeModified as modified:
+            instrumentation.increment("computer.steps", steps)
+            instrumentation.increment("intcode.fused.fallbacks")
+            index, fallback_steps, halted = self.computer.execute(
+                memory, index=modified.next_index, input_values=input_values, outputs=outputs
+            )
+            return index, steps + fallback_steps, halted
+
+        instrumentation.increment("computer.steps", steps)
+        return index, steps, True
+
+    def _compile(self, memory, address, code, input_values, outputs):
+        instruction = decode(memory, address)
+        code.update(range(address, address + instruction.size))
+
+        following_address = address + instruction.size
+        if instruction.opcode != spacecraft.Computer.HALT and following_address < len(memory):
+            try:
+                following = decode(memory, following_address)
+            except ValueError:
+                following = None
+
+            if following is not None and following.opcode in JUMPS and (
+                    is_compare_and_jump(instruction, following)
+                    or (is_add_to_self(instruction) and following.modes[0] == 0
+                        and following.operands[0] == instruction.operands[2])
+            ):
+                code.update(range(following_address, following_address + following.size))
+                self.fused_count += 1
+                return self._compile_fused(instruction, following, code)
+
+        return self._compile_single(instruction, code, input_values, outputs)
+
+    @staticmethod
+    def _reader(operand, mode):
+        if mode == 1:
+            return lambda memory: operand
+
+        return lambda memory: memory[operand]
+
+    def _compile_single(self, instruction, code, input_values, outputs):
+        opcode = instruction.opcode
+        next_address = instruction.address + instruction.size
+        computer = spacecraft.Computer
+
+        if opcode == computer.HALT:
+            return lambda memory: (None, 1)
+
+        readers = [self._reader(operand, mode) for operand, mode in zip(instruction.operands, instruction.modes)]
+
+        if opcode in (computer.ADD, computer.MULT, computer.LESS_THAN, computer.EQUALS):
+            read_a, read_b = readers[0], readers[1]
+            output = instruction.operands[2]
+            operation = {
+                computer.ADD: lambda a, b: a + b,
+                computer.MULT: lambda a, b: a * b,
+                computer.LESS_THAN: lambda a, b: 1 if a < b else 0,
+                computer.EQUALS: lambda a, b: 1 if a == b else 0,
+            }[opcode]
+
+            def arithmetic(memory):
+                memory[output] = operation(read_a(memory), read_b(memory))
+                if output in code:
+                    raise CodeModified(next_address)
+                return next_address, 1
+
+            return arithmetic
+
+        if opcode == computer.STORE:
+            output = instruction.operands[0]
+
+            def store(memory):
+                if input_values is None:
+                    value = int(input("Enter a value to store: "))
+                else:
+                    value = next(input_values, None)
+                    if value is None:
+                        raise RuntimeError(f"No input value available for instruction at {instruction.address}")
+
+                memory[output] = value
+                if output in code:
+                    raise CodeModified(next_address)
+                return next_address, 1
+
+            return store
+
+        if opcode == computer.OUTPUT:
+            read_value = readers[0]
+
+            def output_value(memory):
+                if outputs is None:
+                    print(read_value(memory))
+                else:
+                    outputs.append(read_value(memory))
+                return next_address, 1
+
+            return output_value
+
+        read_value, read_target = readers
+        jump_if_true = opcode == computer.JUMP_IF_TRUE
+
+        def jump(memory):
+            if (read_value(memory) != 0) == jump_if_true:
+                return read_target(memory), 1
+            return next_address, 1
+
+        return jump
+
+    def _compile_fused(self, first, jump, code):
+        computer = spacecraft.Computer
+        output = first.operands[2]
+        jump_address = jump.address
+        next_address = jump.address + jump.size
+        read_target = self._reader(jump.operands[1], jump.modes[1])
+        jump_if_true = jump.opcode == computer.JUMP_IF_TRUE
+
+        if first.opcode == computer.ADD:
+            # A loop counter: add a constant to an address, then jump depending on the new value
+            increment = first.operands[1] if first.modes[1] == 1 else first.operands[0]
+
+            def add_and_jump(memory):
+                value = memory[output] + increment
+                memory[output] = value
+                if output in code:
+                    raise CodeModified(jump_address)
+                if (value != 0) == jump_if_true:
+                    return read_target(memory), 2
+                return next_address, 2
+
+            return add_and_jump
+
+        read_a = self._reader(first.operands[0], first.modes[0])
+        read_b = self._reader(first.operands[1], first.modes[1])
+        less_than = first.opcode == computer.LESS_THAN
+
+        def compare_and_jump(memory):
+            a, b = read_a(memory), read_b(memory)
+            result = a < b if less_than else a == b
+            memory[output] = 1 if result else 0
+            if output in code:
+                raise CodeModified(jump_address)
+            if result == jump_if_true:
+                return read_target(memory), 2
+            return next_address, 2
+
+        return compare_and_jump
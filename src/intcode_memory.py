@@ -0,0 +1,222 @@
+import array
+
+
+class PagedMemory(object):
+    """Sparse intcode memory made up of fixed-size pages which are only allocated when first written to.
+
+    Addresses which have never been written read as 0, so programs can address far beyond their own length while
+    only paying for the pages they actually touch. Each page is stored as an `array('q')` of 64-bit integers, and is
+    promoted to a list of Python ints if a value too large for 64 bits is written to it.
+
+    An optional base image provides the initial contents of memory. It is never modified: a page is copied out of the
+    base image the first time it is written to, so many PagedMemory instances can share a single read-only image.
+
+    PagedMemory supports the indexing, slicing and `len` operations used by `Computer.execute`, so it can be passed
+    anywhere a list of intcode instructions is accepted.
+    """
+
+    def __init__(self, base=None, page_size=1024):
+        """Initializes a new PagedMemory instance.
+
+        Args:
+            base: An optional read-only sequence of integers providing the initial contents of memory.
+            page_size: The number of addresses in each page. Must be a power of two.
+
+        Raises:
+            ValueError: The page size is not a positive power of two.
+        """
+
+        if page_size < 1 or page_size & (page_size - 1):
+            raise ValueError(f"The page size must be a positive power of two. Received {page_size}.")
+
+        self.base = base if base is not None else ()
+        self.page_size = page_size
+        self._shift = page_size.bit_length() - 1
+        self._mask = page_size - 1
+        self._pages = {}
+        self._length = len(self.base)
+
+    def __len__(self):
+        """Returns one more than the highest address that has been written to or is part of the base image."""
+
+        return self._length
+
+    def __iter__(self):
+        for address in range(self._length):
+            yield self[address]
+
+    def __eq__(self, other):
+        try:
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return f"PagedMemory(length={self._length}, pages={len(self._pages)}, page_size={self.page_size})"
+
+    @property
+    def pages_allocated(self):
+        """Returns the number of pages which have been allocated by writes."""
+
+        return len(self._pages)
+
+    def __getitem__(self, address):
+        if isinstance(address, slice):
+            return [self[index] for index in range(*address.indices(self._length))]
+
+        if address < 0:
+            raise IndexError(f"Invalid memory address {address}")
+
+        page = self._pages.get(address >> self._shift)
+        if page is not None:
+            return page[address & self._mask]
+
+        if address < len(self.base):
+            return self.base[address]
+
+        return 0
+
+    def __setitem__(self, address, value):
+        if address < 0:
+            raise IndexError(f"Invalid memory address {address}")
+
+        page_number = address >> self._shift
+        page = self._pages.get(page_number)
+        if page is None:
+            page = self._pages[page_number] = self._allocate(page_number)
+
+        try:
+            page[address & self._mask] = value
+        except OverflowError:
+            page = self._pages[page_number] = list(page)
+            page[address & self._mask] = value
+
+        if address >= self._length:
+            self._length = address + 1
+
+    def _allocate(self, page_number):
+        start = page_number << self._shift
+        contents = list(self.base[start:start + self.page_size])
+        contents.extend([0] * (self.page_size - len(contents)))
+
+        try:
+            return array.array('q', contents)
+        except OverflowError:
+            return contents
+
+    def to_list(self):
+        """Returns a list containing the contents of memory from address 0 up to its length."""
+
+        return list(self)
+
+
+class TypedMemory(object):
+    """Intcode memory stored as packed 64-bit integers, switching to Python ints if a value doesn't fit.
+
+    Values are held in an `array('q')`, or in a view over any writable buffer of int64 values, such as a NumPy
+    int64 array or a `multiprocessing.shared_memory.SharedMemory` block. A buffer is used in place rather than
+    copied, so several processes can run on the same memory without pickling it.
+
+    Only ADD and MULT can produce values which don't fit in 64 bits, and a write which doesn't fit is detected when
+    it is stored. Memory is then promoted to a list of Python ints, and execution continues unaffected. A promoted
+    memory no longer writes to the buffer it was created from, which can be checked with `promoted`.
+    """
+
+    def __init__(self, values=None, buffer=None, length=None):
+        """Initializes a new TypedMemory instance.
+
+        Args:
+            values: An optional iterable of integers to copy into the memory.
+            buffer: An optional writable buffer of int64 values to use as the memory, instead of copying `values`.
+            length: An optional number of values to use from the start of `buffer`, for buffers which may be larger
+            than the memory they hold, such as shared memory blocks.
+
+        Raises:
+            ValueError: Both `values` and `buffer` were provided.
+        """
+
+        if values is not None and buffer is not None:
+            raise ValueError("Memory can be created from either values or a buffer, but not both.")
+
+        if buffer is not None:
+            view = memoryview(buffer).cast("B").cast("q")
+            self._values = view[:length] if length is not None else view
+        else:
+            values = list(values) if values is not None else []
+            try:
+                self._values = array.array("q", values)
+            except OverflowError:
+                self._values = values
+
+    def __len__(self):
+        return len(self._values)
+
+    def __iter__(self):
+        return iter(self._values)
+
+    def __eq__(self, other):
+        try:
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self):
+        return f"TypedMemory(length={len(self)}, promoted={self.promoted})"
+
+    @property
+    def promoted(self):
+        """Returns a boolean indicating whether the memory has switched to arbitrary precision Python ints."""
+
+        return isinstance(self._values, list)
+
+    def __getitem__(self, address):
+        if isinstance(address, slice):
+            return list(self._values[address])
+
+        return self._values[address]
+
+    def __setitem__(self, address, value):
+        try:
+            self._values[address] = value
+        except (OverflowError, ValueError):
+            # Arrays raise OverflowError for values which don't fit, while memoryviews raise ValueError
+            self._promote()
+            self._values[address] = value
+
+    def _promote(self):
+        values = self._values.tolist()
+        if isinstance(self._values, memoryview):
+            self._values.release()
+        self._values = values
+
+    def release(self):
+        """Copies the memory out of the buffer it was created from, so that the buffer can be closed."""
+
+        if isinstance(self._values, memoryview):
+            view = self._values
+            self._values = array.array("q", view)
+            view.release()
+
+    def share(self):
+        """Copies the memory into a new shared memory block, returning the `SharedMemory` instance.
+
+        Other processes can attach to the block by name, and run on it with `TypedMemory(buffer=block.buf,
+        length=...)`. The caller is responsible for closing and unlinking the block.
+
+        Raises:
+            OverflowError: The memory has been promoted and holds values which don't fit in 64 bits.
+        """
+
+        from multiprocessing import shared_memory
+
+        packed = array.array("q", self._values)
+        block = shared_memory.SharedMemory(create=True, size=max(packed.itemsize * len(packed), 1))
+        with block.buf.cast("B") as view:
+            view[:len(packed) * packed.itemsize] = packed.tobytes()
+
+        return block
+
+    def to_list(self):
+        """Returns a list containing the contents of memory."""
+
+        return list(self._values)
@@ -0,0 +1,241 @@
+import array
+import collections
+import struct
+import sys
+import zlib
+
+import spacecraft
+
+MAGIC = b"ICTRACE1"
+
+# Chunks are stored as packed int64 values when every value fits, or as comma separated text otherwise
+_PACKED = 0
+_TEXT = 1
+
+# Each chunk in a file is preceded by its format, the number of records it holds and its compressed size in bytes
+_CHUNK_HEADER = struct.Struct("<BQQ")
+
+
+class TraceRecord(collections.namedtuple("TraceRecord", ["pc", "instruction", "operands", "write"])):
+    """A single executed intcode instruction.
+
+    Attributes:
+        pc: The address of the instruction.
+        instruction: The instruction as stored in memory, including its parameter modes.
+        operands: A tuple containing the instruction's raw parameters, before modes are applied.
+        write: An (address, value) tuple describing the value written to memory, or None if nothing was written.
+    """
+
+    __slots__ = ()
+
+    @property
+    def opcode(self):
+        """Returns the instruction's op code, without its parameter modes."""
+
+        return self.instruction % 100
+
+
+def _encode(values):
+    try:
+        packed = array.array("q", values)
+    except OverflowError:
+        return _TEXT, zlib.compress(",".join(map(str, values)).encode())
+
+    if sys.byteorder == "big":
+        packed.byteswap()
+
+    return _PACKED, zlib.compress(packed.tobytes())
+
+
+def _decode(chunk_format, data):
+    data = zlib.decompress(data)
+    if chunk_format == _TEXT:
+        return [int(value) for value in data.decode().split(",")] if data else []
+
+    packed = array.array("q")
+    packed.frombytes(data)
+    if sys.byteorder == "big":
+        packed.byteswap()
+
+    return packed
+
+
+def _decode_records(values):
+    """Yields the TraceRecords encoded in a list of values, undoing the delta encoding of instruction addresses."""
+
+    instructions = spacecraft.Computer.VALID_INSTRUCTIONS
+    position = 0
+    pc = 0
+    while position < len(values):
+        pc += values[position]
+        instruction = values[position + 1]
+        metadata = instructions[instruction % 100]
+        position += 2
+
+        operands = tuple(values[position:position + metadata.get("parameters", 0)])
+        position += len(operands)
+
+        write = None
+        if metadata.get("output_param") is not None:
+            write = (values[position], values[position + 1])
+            position += 2
+
+        yield TraceRecord(pc, instruction, operands, write)
+
+
+class TraceRecorder(object):
+    """Records every instruction executed by `Computer.intcode` into compressed binary chunks.
+
+    Each record holds the instruction's address, the instruction itself, its raw parameters and, for instructions
+    which write to memory, the address and value written. Addresses are stored as the difference from the previous
+    instruction's address, which is small for everything but jumps. Records are appended to a plain list, which is
+    the cheapest way to collect values in Python, and every `chunk_size` values the list is packed into int64 values
+    and compressed with zlib.
+
+    Chunks are written to a file if one is given, or otherwise kept in memory. In memory, at most `max_chunks` chunks
+    are kept, discarding the oldest, so a recorder can follow a long running program while only keeping its most
+    recent history. Chunks can be decoded independently of one another, so discarding old chunks never prevents the
+    rest from being read.
+
+    Example:
+        with intcode_trace.TraceRecorder("run.trace") as tracer:
+            spacecraft.Computer().intcode(program, tracer=tracer)
+        for record in intcode_trace.read_trace("run.trace"):
+            print(record.pc, record.opcode)
+    """
+
+    def __init__(self, path=None, max_chunks=None, chunk_size=1 << 16):
+        """Initializes a new TraceRecorder instance.
+
+        Args:
+            path: An optional path of a file to write the trace to, replacing any existing file.
+            max_chunks: An optional maximum number of chunks to keep when recording in memory.
+            chunk_size: The number of values to collect before compressing them into a chunk.
+
+        Raises:
+            ValueError: A non-positive value was provided for `chunk_size` or `max_chunks`, or `max_chunks` was
+            provided along with `path`.
+        """
+
+        if chunk_size < 1:
+            raise ValueError(f"The chunk size must be a positive integer. Received {chunk_size}.")
+        if max_chunks is not None and max_chunks < 1:
+            raise ValueError(f"At least one chunk must be kept. Received {max_chunks}.")
+        if max_chunks is not None and path is not None:
+            raise ValueError("Chunks are only discarded when recording in memory, not when recording to a file.")
+
+        self.path = path
+        self.chunk_size = chunk_size
+        self.records = 0
+        self.chunks = collections.deque(maxlen=max_chunks)
+        self._values = []
+        self._chunk_records = 0
+        self._last_pc = 0
+        self._file = None
+        if path is not None:
+            self._file = open(path, "wb")
+            self._file.write(MAGIC)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def record(self, pc, instruction, operands, write_address=None, write_value=None):
+        """Records a single executed instruction.
+
+        Args:
+            pc: The address of the instruction.
+            instruction: The instruction as stored in memory, including its parameter modes.
+            operands: A sequence of the instruction's raw parameters.
+            write_address: The address written to by the instruction, or None if it didn't write to memory.
+            write_value: The value written to memory by the instruction.
+        """
+
+        values = self._values
+        values.append(pc - self._last_pc)
+        values.append(instruction)
+        values.extend(operands)
+        if write_address is not None:
+            values.append(write_address)
+            values.append(write_value)
+
+        self._last_pc = pc
+        self._chunk_records += 1
+        if len(values) >= self.chunk_size:
+            self.flush()
+
+    def flush(self):
+        """Compresses any values which have been collected into a chunk."""
+
+        if not self._chunk_records:
+            return
+
+        chunk_format, data = _encode(self._values)
+        self.records += self._chunk_records
+        if self._file is not None:
+            self._file.write(_CHUNK_HEADER.pack(chunk_format, self._chunk_records, len(data)))
+            self._file.write(data)
+        else:
+            self.chunks.append((chunk_format, self._chunk_records, data))
+
+        self._values = []
+        self._chunk_records = 0
+
+        # Each chunk starts from an absolute address, so that it can be decoded without the chunks before it
+        self._last_pc = 0
+
+    def close(self):
+        """Flushes any collected values, and closes the trace file if there is one."""
+
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    @property
+    def compressed_size(self):
+        """Returns the number of bytes taken by the compressed chunks held in memory."""
+
+        return sum(len(data) for _, _, data in self.chunks)
+
+
+def _read_file_chunks(path):
+    with open(path, "rb") as trace_file:
+        if trace_file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not an intcode trace file.")
+
+        while True:
+            header = trace_file.read(_CHUNK_HEADER.size)
+            if not header:
+                return
+            if len(header) < _CHUNK_HEADER.size:
+                raise ValueError(f"{path} ends part way through a chunk.")
+
+            chunk_format, records, length = _CHUNK_HEADER.unpack(header)
+            data = trace_file.read(length)
+            if len(data) < length:
+                raise ValueError(f"{path} ends part way through a chunk.")
+
+            yield chunk_format, records, data
+
+
+def read_trace(source):
+    """Yields each TraceRecord in a trace, in the order the instructions were executed.
+
+    Args:
+        source: A TraceRecorder, whose chunks held in memory and any values not yet compressed are read, or the path
+        of a trace file written by a TraceRecorder.
+
+    Raises:
+        ValueError: The file is not a trace file, or is incomplete.
+    """
+
+    if isinstance(source, TraceRecorder):
+        for chunk_format, _, data in list(source.chunks):
+            yield from _decode_records(_decode(chunk_format, data))
+        yield from _decode_records(list(source._values))
+    else:
+        for chunk_format, _, data in _read_file_chunks(source):
+            yield from _decode_records(_decode(chunk_format, data))
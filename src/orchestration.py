@@ -0,0 +1,221 @@
+import asyncio
+import collections
+
+import spacecraft
+
+# Put in a waiting machine's inbox to wake it when no machine can ever send it a value
+_DEADLOCKED = object()
+
+
+class Machine(object):
+    """An intcode program hosted by a Scheduler, communicating with other machines through asyncio queues.
+
+    Each machine runs its own copy of a program on a shared `Computer`, resuming from where it left off every time
+    it is given a time slice. Its `inbox` and `outbox` queues are created when the scheduler starts running, so that
+    they belong to the scheduler's event loop; until then, values can be queued up with `send`.
+    """
+
+    def __init__(self, program, name=None, inputs=None):
+        """Initializes a new Machine instance.
+
+        Args:
+            program: A list of integers representing the intcode program to run. The machine runs on a copy.
+            name: An optional name identifying the machine.
+            inputs: An optional iterable of integers to provide as the machine's first inputs.
+        """
+
+        self.name = name
+        self.memory = list(program)
+        self.index = 0
+        self.steps = 0
+        self.halted = False
+        self.outputs = []
+        self.inbox = None
+        self.outbox = None
+        self.target = None
+        self._buffer = collections.deque(inputs or [])
+
+    def __repr__(self):
+        return f"Machine(name={self.name!r}, index={self.index}, halted={self.halted})"
+
+    def send(self, value):
+        """Queues a value as input to the machine."""
+
+        if self.inbox is None:
+            self._buffer.append(value)
+        else:
+            self.inbox.put_nowait(value)
+
+    def connect(self, target):
+        """Sends every value this machine outputs to the input of another machine.
+
+        Args:
+            target: The Machine which should receive this machine's outputs.
+        """
+
+        self.target = target
+
+    def _drain_inbox(self):
+        while not self.inbox.empty():
+            self._buffer.append(self.inbox.get_nowait())
+
+    def _take_buffered(self):
+        while self._buffer:
+            yield self._buffer.popleft()
+
+    def run_slice(self, computer, slice_size):
+        """Executes up to `slice_size` instructions, returning a boolean indicating whether it is blocked on input."""
+
+        self._drain_inbox()
+        new_outputs = []
+        self.index, steps, self.halted = computer.execute(
+            self.memory,
+            index=self.index,
+            input_values=self._take_buffered(),
+            outputs=new_outputs,
+            max_steps=slice_size,
+            wait_for_input=True
+        )
+        self.steps += steps
+
+        for value in new_outputs:
+            self.outbox.put_nowait(value)
+        self.outputs.extend(new_outputs)
+
+        return not self.halted and steps < slice_size and not self._buffer
+
+
+class Scheduler(object):
+    """Runs many intcode machines concurrently in a single thread using asyncio.
+
+    Every machine runs as its own task, executing a fixed number of instructions per time slice before yielding to
+    the others. A machine which needs input that hasn't arrived yet waits on its inbox without using any time
+    slices, so pipelines and feedback loops of machines cost nothing while they wait on one another.
+    """
+
+    def __init__(self, slice_size=1000):
+        """Initializes a new Scheduler instance.
+
+        Args:
+            slice_size: The maximum number of instructions a machine executes before yielding to other machines.
+
+        Raises:
+            ValueError: A non-positive value was provided for `slice_size`.
+        """
+
+        if slice_size < 1:
+            raise ValueError(f"The slice size must be a positive integer. Received {slice_size}.")
+
+        self.slice_size = slice_size
+        self.machines = []
+        self._computer = spacecraft.Computer()
+        self._running = 0
+        self._waiting = set()
+
+    def add_machine(self, program, name=None, inputs=None):
+        """Creates a new Machine hosted by the scheduler, returning it.
+
+        Args:
+            program: A list of integers representing the intcode program to run.
+            name: An optional name identifying the machine.
+            inputs: An optional iterable of integers to provide as the machine's first inputs.
+        """
+
+        machine = Machine(program, name=name if name is not None else len(self.machines), inputs=inputs)
+        self.machines.append(machine)
+
+        return machine
+
+    def pipeline(self, program, inputs, feedback=False):
+        """Creates a chain of machines running the same program, each sending its outputs to the next.
+
+        Args:
+            program: A list of integers representing the intcode program for every machine to run.
+            inputs: A list containing, for each machine in the chain, an iterable of its first inputs.
+            feedback: A boolean indicating whether the last machine's outputs should loop back to the first.
+
+        Returns:
+            A list of the machines in the chain, in order.
+        """
+
+        machines = [self.add_machine(program, inputs=machine_inputs) for machine_inputs in inputs]
+        for machine, next_machine in zip(machines, machines[1:]):
+            machine.connect(next_machine)
+
+        if feedback and machines:
+            machines[-1].connect(machines[0])
+
+        return machines
+
+    async def _run_machine(self, machine):
+        while True:
+            blocked = machine.run_slice(self._computer, self.slice_size)
+            if machine.halted:
+                return
+
+            if not blocked:
+                # Let the other machines have a turn before continuing
+                await asyncio.sleep(0)
+                continue
+
+            self._waiting.add(machine)
+            try:
+                if self._is_deadlocked():
+                    raise RuntimeError("Every running machine is waiting for input which will never arrive.")
+                value = await machine.inbox.get()
+            finally:
+                self._waiting.discard(machine)
+
+            if value is _DEADLOCKED:
+                raise RuntimeError("Every running machine is waiting for input which will never arrive.")
+            machine._buffer.append(value)
+
+    def _is_deadlocked(self):
+        """Returns a boolean indicating whether every running machine is waiting for input nobody can send."""
+
+        return (
+            self._running > 0
+            and len(self._waiting) == self._running
+            and all(other.inbox.empty() for other in self.machines if not other.halted)
+        )
+
+    async def _run_and_track(self, machine):
+        try:
+            await self._run_machine(machine)
+        finally:
+            self._running -= 1
+            # The machines still waiting may have been waiting on this one, which can no longer send them anything
+            if self._is_deadlocked():
+                for waiting_machine in self._waiting:
+                    waiting_machine.inbox.put_nowait(_DEADLOCKED)
+
+    async def run(self):
+        """Runs every machine until all of them have halted.
+
+        Returns:
+            The list of machines hosted by the scheduler.
+
+        Raises:
+            RuntimeError: Every machine which has not halted is waiting for input, so none of them can continue.
+        """
+
+        for machine in self.machines:
+            machine.inbox = asyncio.Queue()
+        for machine in self.machines:
+            machine.outbox = machine.target.inbox if machine.target is not None else asyncio.Queue()
+
+        self._running = len(self.machines)
+        self._waiting = set()
+        tasks = [asyncio.ensure_future(self._run_and_track(machine)) for machine in self.machines]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return self.machines
+
+    def run_until_complete(self):
+        """Runs every machine in a new event loop until all of them have halted, returning the list of machines."""
+
+        return asyncio.run(self.run())
@@ -0,0 +1,245 @@
+import array
+import hashlib
+import mmap
+import os
+import re
+import warnings
+
+import instrumentation
+
+INPUTS_DIR = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "inputs"))
+CACHE_DIR = os.environ.get(
+    "AOC_INPUT_CACHE",
+    os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", ".input_cache"))
+)
+
+# Matches two commas with nothing but whitespace between them
+_EMPTY_FIELD = re.compile(rb",\s*,")
+
+
+def input_path(filename):
+    """Returns the absolute path to a puzzle input file.
+
+    Paths are resolved relative to the repository rather than the current working directory, so the day modules
+    behave the same whether they are run from the repository root, from `src`, or from the benchmark runner.
+
+    Args:
+        filename: The name of the file within the `inputs` directory.
+    """
+
+    return os.path.join(INPUTS_DIR, filename)
+
+
+def _cache_path(content, kind, cache_dir):
+    return os.path.join(cache_dir, f"{hashlib.sha256(content).hexdigest()}-{kind}.bin")
+
+
+def _read_cached(path):
+    """Returns the int64 values stored in a cache file as a list, or None if the file is missing or unreadable."""
+
+    try:
+        with open(path, "rb") as cache_file:
+            if os.fstat(cache_file.fileno()).st_size == 0:
+                return []
+
+            with mmap.mmap(cache_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view, view.cast("q") as values:
+                    return values.tolist()
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def _write_cached(path, values):
+    """Stores a list of integers in a cache file as int64 values. Values that don't fit are silently not cached."""
+
+    try:
+        packed = array.array("q", values)
+    except OverflowError:
+        return
+
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, "wb") as cache_file:
+            packed.tofile(cache_file)
+
+        # Replacing the file atomically means a concurrent reader never sees a partially written cache entry
+        os.replace(temp_path, path)
+    except OSError:
+        pass
+
+
+def _load(filename, kind, parse, cache_dir):
+    with open(input_path(filename), "rb") as in_file:
+        content = in_file.read()
+
+    if cache_dir is None:
+        return parse(content)
+
+    path = _cache_path(content, kind, cache_dir)
+    values = _read_cached(path)
+    if values is None:
+        instrumentation.increment("puzzle_inputs.cache_miss")
+        with instrumentation.timer("puzzle_inputs.parse"):
+            values = parse(content)
+        _write_cached(path, values)
+    else:
+        instrumentation.increment("puzzle_inputs.cache_hit")
+
+    return values
+
+
+def _parse_ints(content):
+    return parse_ints(content)
+
+
+def _parse_wires(content):
+    """Returns wire offsets flattened as [wire count, length of each wire..., x offset, y offset, ...]."""
+
+    # Imported here so that days which don't use wires don't pay for importing the wire classes
+    import systems
+
+    lengths = []
+    offsets = []
+    for line in content.decode().splitlines():
+        if not line.strip():
+            continue
+
+        instructions = [instruction.strip() for instruction in line.split(",")]
+        lengths.append(len(instructions))
+        for instruction in instructions:
+            offsets.extend(systems.Wire.parse_instruction(instruction))
+
+    return [len(lengths)] + lengths + offsets
+
+
+def parse_ints(data, as_array=False):
+    """Parses the integers from a buffer of comma or whitespace separated text.
+
+    When NumPy is available the whole buffer is handed to NumPy's text parser in a single call, which converts it
+    straight into an int64 array without creating a Python int for each value. NumPy's parser only accepts `bytes`,
+    so a buffer of another type (such as an `mmap`) is copied into `bytes` once. Text separated only by commas is
+    parsed as it is; anything else is copied once more with its commas replaced by spaces. Without NumPy, the buffer
+    is split and each value converted with `int`.
+
+    Args:
+        data: A bytes-like object (such as `bytes` or an `mmap`) containing the text to parse.
+        as_array: A boolean indicating whether to return a NumPy int64 array rather than a list.
+
+    Returns:
+        A list (or NumPy array) of the integers in the buffer.
+
+    Raises:
+        ValueError: The buffer contains something other than integers separated by commas and whitespace, has an
+        empty field between two commas or at either end, or `as_array` was requested for values too large to store
+        in an int64 array.
+        ImportError: `as_array` was requested but NumPy is not installed.
+    """
+
+    text = bytes(data)
+    stripped = text.strip()
+    if stripped.startswith(b",") or stripped.endswith(b",") or _EMPTY_FIELD.search(stripped):
+        # Both parsers below would silently skip an empty field, shifting the position of every later value
+        raise ValueError("Input contains an empty field between commas.")
+
+    try:
+        import numpy as np
+    except ImportError:
+        if as_array:
+            raise
+        return _split_ints(text)
+
+    if not stripped:
+        # NumPy parses text containing no numbers as a single 0
+        return np.empty(0, dtype=np.int64) if as_array else []
+
+    values = _numpy_parse(np, text, b",")
+    if values is None:
+        values = _numpy_parse(np, text.replace(b",", b" "), b" ")
+    if values is None:
+        raise ValueError("Input contains something other than integers separated by commas and whitespace.")
+
+    int64_limits = np.iinfo(np.int64)
+    if values.size and (values.max() == int64_limits.max or values.min() == int64_limits.min):
+        # NumPy saturates values which don't fit, so a value at either limit may really be larger. Only the text
+        # can tell, so parse it exactly and compare.
+        exact_values = _split_ints(text)
+        if exact_values != values.tolist():
+            if as_array:
+                raise ValueError("Input contains integers too large to store in an int64 array.")
+            return exact_values
+
+    return values if as_array else values.tolist()
+
+
+def _split_ints(text):
+    return [int(value) for value in text.replace(b",", b" ").split()]
+
+
+def _numpy_parse(np, text, separator):
+    """Returns an int64 array of the integers in text split by a separator, or None if the text doesn't parse."""
+
+    with warnings.catch_warnings():
+        # Older versions of NumPy only warn about unparseable text, returning whatever was read up to that point
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            return np.fromstring(text, dtype=np.int64, sep=separator.decode())
+        except (ValueError, DeprecationWarning):
+            return None
+
+
+def load_program(filename, as_array=False):
+    """Parses a comma separated program from a memory-mapped input file, bypassing the parse cache.
+
+    The mapped file is copied into `bytes` once for NumPy's text parser (see `parse_ints`), but never read into a
+    Python string or split into a list of strings.
+
+    Args:
+        filename: The name of the file within the `inputs` directory.
+        as_array: A boolean indicating whether to return a NumPy int64 array rather than a list.
+    """
+
+    with open(input_path(filename), "rb") as in_file:
+        if os.fstat(in_file.fileno()).st_size == 0:
+            return parse_ints(b"", as_array=as_array)
+
+        with mmap.mmap(in_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return parse_ints(mapped, as_array=as_array)
+
+
+def load_ints(filename, cache_dir=CACHE_DIR):
+    """Returns a list of the integers in a comma or whitespace separated input file.
+
+    Parsed values are stored in `cache_dir` as a packed int64 array keyed by a hash of the file's contents, so
+    later loads of the same file map the packed array instead of parsing the text again. Changing the file changes
+    its hash, which invalidates the cached entry automatically.
+
+    Args:
+        filename: The name of the file within the `inputs` directory.
+        cache_dir: The directory in which parsed inputs are cached, or None to disable caching.
+    """
+
+    return _load(filename, "ints", _parse_ints, cache_dir)
+
+
+def load_wire_offsets(filename, cache_dir=CACHE_DIR):
+    """Returns a list containing, for each line in an input file, a list of (x, y) offsets describing a wire's path.
+
+    Parsed offsets are cached in the same way as `load_ints`.
+
+    Args:
+        filename: The name of the file within the `inputs` directory.
+        cache_dir: The directory in which parsed inputs are cached, or None to disable caching.
+    """
+
+    values = _load(filename, "wires", _parse_wires, cache_dir)
+
+    wire_count = values[0]
+    position = 1 + wire_count
+    wires = []
+    for length in values[1:1 + wire_count]:
+        flat = values[position:position + 2 * length]
+        wires.append(list(zip(flat[::2], flat[1::2])))
+        position += 2 * length
+
+    return wires
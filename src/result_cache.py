@@ -0,0 +1,210 @@
+import collections
+import hashlib
+import json
+import os
+
+import instrumentation
+
+
+def result_key(program, patches=None, input_values=()):
+    """Returns a hex digest identifying the result of running a program.
+
+    Args:
+        program: A sequence of integers representing the unpatched intcode program.
+        patches: An optional mapping of addresses to the values written to them before the program runs.
+        input_values: A sequence of integers provided to the program's STORE instructions.
+    """
+
+    digest = hashlib.sha256()
+    digest.update(",".join(map(str, program)).encode())
+    digest.update(b"|")
+    digest.update(",".join(f"{address}:{value}" for address, value in sorted((patches or {}).items())).encode())
+    digest.update(b"|")
+    digest.update(",".join(map(str, input_values)).encode())
+
+    return digest.hexdigest()
+
+
+class ResultCache(object):
+    """Memoizes the final memory and outputs of intcode programs, keyed by program, patches and input values.
+
+    Intcode programs are deterministic, so running the same program with the same patches and inputs always gives
+    the same result. Results are kept in an in-process LRU, and optionally in a directory on disk so that they
+    survive between runs. When the files on disk grow beyond `max_disk_bytes`, the least recently used are deleted.
+    """
+
+    def __init__(self, max_entries=256, cache_dir=None, max_disk_bytes=64 * 1024 * 1024):
+        """Initializes a new ResultCache instance.
+
+        Args:
+            max_entries: The maximum number of results to keep in memory.
+            cache_dir: An optional directory in which to store results on disk.
+            max_disk_bytes: The maximum total size of the result files stored in `cache_dir`.
+
+        Raises:
+            ValueError: A non-positive value was provided for `max_entries`.
+        """
+
+        if max_entries < 1:
+            raise ValueError(f"The cache must hold at least one entry. Received {max_entries}.")
+
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._disk_bytes = None
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key):
+        """Returns the (memory, outputs) tuple of lists stored under a key, or None if there is no such result."""
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+            instrumentation.increment("result_cache.memory_hit")
+        elif self.cache_dir is not None:
+            entry = self._read(key)
+            if entry is not None:
+                self._remember(key, entry)
+                instrumentation.increment("result_cache.disk_hit")
+
+        if entry is None:
+            self.misses += 1
+            instrumentation.increment("result_cache.miss")
+            return None
+
+        self.hits += 1
+        memory, outputs = entry
+
+        return list(memory), list(outputs)
+
+    def put(self, key, memory, outputs):
+        """Stores the final memory and outputs of a program under a key.
+
+        Args:
+            key: A key as returned by `result_key`.
+            memory: A sequence of integers containing the program's final memory.
+            outputs: A sequence of integers output by the program.
+        """
+
+        entry = (tuple(memory), tuple(outputs))
+        self._remember(key, entry)
+        if self.cache_dir is not None:
+            self._write(key, entry)
+
+    def run(self, computer, program, patches=None, input_values=(), fuse=False):
+        """Runs a program on a copy of its memory, returning a cached result if it has been run before.
+
+        Args:
+            computer: The Computer with which to run the program on a cache miss.
+            program: A list of integers representing the intcode program. It is not modified.
+            patches: An optional mapping of addresses to the values written to them before the program runs.
+            input_values: A finite iterable of integers provided to the program's STORE instructions.
+            fuse: A boolean indicating whether to run the program with `intcode_analysis.FusedInterpreter`.
+
+        Returns:
+            A (memory, outputs) tuple of lists containing the program's final memory and outputs.
+        """
+
+        input_values = tuple(input_values)
+        key = result_key(program, patches, input_values)
+        result = self.get(key)
+        if result is not None:
+            return result
+
+        memory = list(program)
+        for address, value in (patches or {}).items():
+            memory[address] = value
+
+        outputs = []
+        computer.intcode(memory, input_values=input_values, outputs=outputs, fuse=fuse)
+        self.put(key, memory, outputs)
+
+        return memory, outputs
+
+    def clear(self):
+        """Discards every result held in memory. Results stored on disk are kept."""
+
+        self._entries.clear()
+
+    def _remember(self, key, entry):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _read(self, key):
+        path = self._path(key)
+        try:
+            with open(path) as cache_file:
+                stored = json.load(cache_file)
+            # Touching the file marks it as recently used, so that eviction removes the least recently used first
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+
+        return tuple(stored["memory"]), tuple(stored["outputs"])
+
+    def _write(self, key, entry):
+        path = self._path(key)
+        memory, outputs = entry
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            temp_path = f"{path}.{os.getpid()}.tmp"
+            with open(temp_path, "w") as cache_file:
+                json.dump({"memory": memory, "outputs": outputs}, cache_file, separators=(",", ":"))
+
+            os.replace(temp_path, path)
+            size = os.path.getsize(path)
+        except OSError:
+            return
+
+        if self._disk_bytes is None:
+            self._disk_bytes = sum(size for _, size, _ in self._disk_entries())
+        else:
+            self._disk_bytes += size
+
+        if self._disk_bytes > self.max_disk_bytes:
+            self._evict()
+
+    def _disk_entries(self):
+        """Yields a (path, size, last used time) tuple for each result file stored on disk."""
+
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return
+
+        for name in names:
+            if not name.endswith(".json"):
+                continue
+
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+
+            yield path, stat.st_size, stat.st_mtime
+
+    def _evict(self):
+        entries = sorted(self._disk_entries(), key=lambda entry: entry[2])
+        self._disk_bytes = sum(size for _, size, _ in entries)
+        for path, size, _ in entries:
+            if self._disk_bytes <= self.max_disk_bytes:
+                break
+
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+
+            self._disk_bytes -= size
+            instrumentation.increment("result_cache.evicted")
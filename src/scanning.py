@@ -0,0 +1,122 @@
+import collections
+import itertools
+import os
+
+
+def _scan_chunk(predicate, chunk_start, chunk_stop, collect):
+    """Applies a predicate to every integer in a chunk, returning either the matches or the number of matches."""
+
+    if collect:
+        return [value for value in range(chunk_start, chunk_stop) if predicate(value)]
+
+    matches = 0
+    for value in range(chunk_start, chunk_stop):
+        if predicate(value):
+            matches += 1
+
+    return matches
+
+
+def scan_range(predicate, range_min, range_max, collect=False, limit=None, chunk_size=None, processes=None,
+               progress=None):
+    """Applies a predicate to every integer in a range, splitting the range into chunks run in a process pool.
+
+    Any picklable single-argument predicate may be used, such as `day4.password_meets_criteria`, so new rules can be
+    tried out over a whole range without writing a dedicated engine for them.
+
+    Args:
+        predicate: A module-level function accepting an integer and returning a boolean.
+        range_min: The lowest integer (inclusive) to consider.
+        range_max: The highest integer (exclusive) to consider.
+        collect: A boolean indicating whether to return the matching integers rather than the number of matches.
+        limit: An optional number of matches after which scanning stops early. Only the first `limit` matches
+        (in ascending order) are counted or collected.
+        chunk_size: The number of integers handed to a worker at a time. Defaults to spreading the range over
+        several chunks per worker.
+        processes: The number of worker processes to use. Defaults to the number of CPUs. If 1, the range is
+        scanned in the current process, in which case the predicate need not be picklable.
+        progress: An optional callable accepting the number of integers scanned so far and the total number
+        of integers in the range, called after each chunk completes.
+
+    Returns:
+        An integer indicating the number of matches, or a list of the matching integers in ascending order if
+        `collect` is True.
+
+    Raises:
+        ValueError: A non-positive value was provided for `chunk_size`, `processes` or `limit`.
+    """
+
+    if processes is None:
+        processes = os.cpu_count() or 1
+    if processes < 1:
+        raise ValueError(f"At least one process is required. Received {processes}.")
+    if limit is not None and limit < 1:
+        raise ValueError(f"The limit must be a positive integer. Received {limit}.")
+
+    total = max(range_max - range_min, 0)
+    if chunk_size is None:
+        chunk_size = max(total // (processes * 8), 1)
+    if chunk_size < 1:
+        raise ValueError(f"The chunk size must be a positive integer. Received {chunk_size}.")
+
+    chunks = ((start, min(start + chunk_size, range_max)) for start in range(range_min, range_max, chunk_size))
+    matches = [] if collect else 0
+    scanned = 0
+
+    def accumulate(result):
+        """Adds a chunk's result to the running matches, returning a boolean indicating whether to stop."""
+
+        nonlocal matches
+        if collect:
+            matches.extend(result)
+            if limit is not None and len(matches) >= limit:
+                del matches[limit:]
+                return True
+        else:
+            matches += result
+            if limit is not None and matches >= limit:
+                matches = limit
+                return True
+
+        return False
+
+    def report(chunk):
+        nonlocal scanned
+        scanned += chunk[1] - chunk[0]
+        if progress is not None:
+            progress(scanned, total)
+
+    if processes == 1:
+        for chunk in chunks:
+            result = _scan_chunk(predicate, chunk[0], chunk[1], collect)
+            report(chunk)
+            if accumulate(result):
+                break
+
+        return matches
+
+    # Process pools are only imported when needed, as they are comparatively slow to import
+    import concurrent.futures
+
+    with concurrent.futures.ProcessPoolExecutor(max_workers=processes) as executor:
+        # Only a few chunks per worker are in flight at once, so early stopping doesn't wait on a huge backlog.
+        # Results are consumed in range order so that early stopping always keeps the lowest matches.
+        pending = collections.deque()
+        for chunk in itertools.islice(chunks, processes * 2):
+            pending.append((chunk, executor.submit(_scan_chunk, predicate, chunk[0], chunk[1], collect)))
+
+        while pending:
+            chunk, future = pending.popleft()
+            result = future.result()
+            report(chunk)
+            if accumulate(result):
+                for _, future in pending:
+                    future.cancel()
+                break
+
+            for next_chunk in itertools.islice(chunks, 1):
+                pending.append(
+                    (next_chunk, executor.submit(_scan_chunk, predicate, next_chunk[0], next_chunk[1], collect))
+                )
+
+    return matches
@@ -0,0 +1,85 @@
+import importlib
+import re
+
+PART_FUNCTION_PATTERN = re.compile(r"^part(\d+)$")
+
+# Day solvers are registered by module name, so that nothing is imported for a day until it is actually run
+DAYS = {
+    1: "day1",
+    2: "day2",
+    3: "day3",
+    4: "day4",
+    5: "day5",
+}
+
+
+def load(day):
+    """Imports and returns the module solving a given day's puzzle.
+
+    Args:
+        day: An integer indicating the day.
+
+    Raises:
+        ValueError: No solver is registered for the day.
+    """
+
+    if day not in DAYS:
+        raise ValueError(f"No solver is registered for day {day}.")
+
+    return importlib.import_module(DAYS[day])
+
+
+def parts(day):
+    """Returns a list of the names of the functions solving each part of a given day's puzzle.
+
+    Each `partN` function in a day's module is a separate part. Modules without any `partN` functions are treated as
+    a single part, run through `main`.
+
+    Args:
+        day: An integer indicating the day.
+    """
+
+    module = load(day)
+    part_names = sorted(
+        (int(match.group(1)), name)
+        for name, match in ((name, PART_FUNCTION_PATTERN.match(name)) for name in dir(module))
+        if match is not None and callable(getattr(module, name))
+    )
+
+    return [name for _, name in part_names] or ["main"]
+
+
+def solver(day, part=None):
+    """Returns the function solving a given day's puzzle, or a single part of it.
+
+    Args:
+        day: An integer indicating the day.
+        part: An optional integer indicating the part. If not provided, the function solving every part is returned.
+
+    Raises:
+        ValueError: No solver is registered for the day or part.
+    """
+
+    module = load(day)
+    if part is None:
+        return module.main
+
+    part_function = getattr(module, f"part{part}", None)
+    if part_function is None:
+        raise ValueError(f"Day {day} has no part {part}.")
+
+    return part_function
+
+
+def run(day, part=None):
+    """Runs the solver for a given day's puzzle, or for a single part of it.
+
+    Args:
+        day: An integer indicating the day.
+        part: An optional integer indicating the part to run. If not provided, every part is run.
+
+    Raises:
+        ValueError: No solver is registered for the day or part.
+    """
+
+    solver(day, part)()
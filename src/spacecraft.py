@@ -1,12 +1,23 @@
 import math
 
+import instrumentation
+
 
 class Spacecraft(object):
-    """A spacecraft consisting of an arbitrary number of modules."""
+    """A spacecraft consisting of an arbitrary number of modules.
+
+    Modules may themselves contain sub-modules, so the spacecraft acts as the root of a tree of assemblies.
+    Mass and fuel totals are cached at every level of the tree; changing a module only invalidates the
+    cached totals along the path from that module up to the spacecraft.
+    """
 
     def __init__(self, modules=None):
-        self._modules = modules or []
+        self._modules = []
         self._mass = None
+        self._fuel_requirement = None
+
+        for module in modules or []:
+            self.add_module(module)
 
     def add_module(self, module):
         """Adds a module to the spacecraft.
@@ -15,10 +26,38 @@ class Spacecraft(object):
             module: A Module instance to be added to the spacecraft.
         """
         if isinstance(module, Module):
+            module.detach()
+            module.parent = self
             self._modules.append(module)
 
-            # Force recalculation of mass next time it is accessed
-            self._mass = None
+            # Force recalculation of totals next time they are accessed
+            self._invalidate()
+
+    def remove_module(self, module):
+        """Removes a module (and any of its sub-modules) from the spacecraft.
+
+        Args:
+            module: A Module instance previously added to the spacecraft.
+
+        Raises:
+            ValueError: The module provided is not attached to the spacecraft.
+        """
+        if module not in self._modules:
+            raise ValueError("Module is not attached to this spacecraft.")
+
+        self._modules.remove(module)
+        module.parent = None
+        self._invalidate()
+
+    @property
+    def modules(self):
+        """Returns a tuple of the top-level modules attached to the spacecraft."""
+
+        return tuple(self._modules)
+
+    def _invalidate(self):
+        self._mass = None
+        self._fuel_requirement = None
 
     @property
     def mass(self):
@@ -32,17 +71,20 @@ class Spacecraft(object):
     def _calculate_mass(self):
         self._mass = 0
         for module in self._modules:
-            self._mass += module.mass
+            self._mass += module.total_mass
 
     @property
     def fuel_requirement(self):
         """Returns an integer indicating the amount of fuel required to get the spaceship into orbit."""
 
-        total_fuel = 0
-        for module in self._modules:
-            total_fuel += module.fuel_requirement
+        if self._fuel_requirement is None:
+            total_fuel = 0
+            for module in self._modules:
+                total_fuel += module.total_fuel_requirement
 
-        return total_fuel
+            self._fuel_requirement = total_fuel
+
+        return self._fuel_requirement
 
 
 class Matter(object):
@@ -88,16 +130,137 @@ class Fuel(Matter):
         qty = self.matter_fuel_requirement
 
         if qty > 0:
-            qty += Fuel(qty).fuel_requirement
+            if instrumentation.enabled:
+                with instrumentation.nested("fuel.recursion_depth"):
+                    qty += Fuel(qty).fuel_requirement
+            else:
+                qty += Fuel(qty).fuel_requirement
             return qty
         else:
             return 0
 
 
 class Module(Matter):
-    """An abstract class to represent a ship module."""
+    """An abstract class to represent a ship module.
+
+    A module may contain any number of sub-modules, forming an assembly. Each module caches the mass and fuel
+    requirement of its whole subtree, and changes to a module invalidate only the caches of its ancestors.
+    """
+
+    def __init__(self, mass=0, modules=None):
+        super(Module, self).__init__(mass)
+        self.parent = None
+        self._modules = []
+        self._total_mass = None
+        self._total_fuel_requirement = None
+
+        for module in modules or []:
+            self.add_module(module)
 
-    pass
+    @Matter.mass.setter
+    def mass(self, value):
+        """Sets this module's own mass, invalidating the cached totals of the module and its ancestors."""
+
+        self._mass = value
+        self._invalidate()
+
+    @property
+    def modules(self):
+        """Returns a tuple of the sub-modules directly contained by this module."""
+
+        return tuple(self._modules)
+
+    def add_module(self, module):
+        """Adds a sub-module to this module.
+
+        Args:
+            module: A Module instance to be contained by this module. If the module is already attached
+            elsewhere, it is detached from its previous parent first.
+
+        Raises:
+            TypeError: The value provided is not an instance of Module.
+            ValueError: Adding the module would create a cycle in the assembly.
+        """
+        if not isinstance(module, Module):
+            raise TypeError(f"Sub-modules must be instances of Module. Received {type(module)}.")
+
+        ancestor = self
+        while isinstance(ancestor, Module):
+            if ancestor is module:
+                raise ValueError("A module cannot contain itself or one of its ancestors.")
+            ancestor = ancestor.parent
+
+        module.detach()
+        module.parent = self
+        self._modules.append(module)
+        self._invalidate()
+
+    def remove_module(self, module):
+        """Removes a sub-module (and its own sub-modules) from this module.
+
+        Args:
+            module: A Module instance directly contained by this module.
+
+        Raises:
+            ValueError: The module provided is not a sub-module of this module.
+        """
+        if module not in self._modules:
+            raise ValueError("Module is not a sub-module of this module.")
+
+        self._modules.remove(module)
+        module.parent = None
+        self._invalidate()
+
+    def detach(self):
+        """Removes this module from its parent module or spacecraft, if it has one."""
+
+        if self.parent is not None:
+            self.parent.remove_module(self)
+
+    def _invalidate(self):
+        node = self
+        while node is not None:
+            if isinstance(node, Module):
+                if node._total_mass is None and node._total_fuel_requirement is None and node is not self:
+                    # Computing any total also computes every total below it, so if this ancestor is already
+                    # invalid then every module above it must be too.
+                    break
+                node._total_mass = None
+                node._total_fuel_requirement = None
+                node = node.parent
+            else:
+                node._invalidate()
+                break
+
+    @property
+    def total_mass(self):
+        """Returns an integer representing the combined mass of this module and all of its sub-modules."""
+
+        if self._total_mass is None:
+            total_mass = self.mass
+            for module in self._modules:
+                total_mass += module.total_mass
+
+            self._total_mass = total_mass
+
+        return self._total_mass
+
+    @property
+    def total_fuel_requirement(self):
+        """Returns an integer representing the fuel required to launch this module and all of its sub-modules.
+
+        Fuel is calculated separately for each module in the assembly and then summed. Massless modules (such as
+        assemblies which only group other modules) require no fuel of their own.
+        """
+
+        if self._total_fuel_requirement is None:
+            total_fuel = self.fuel_requirement if self.mass else 0
+            for module in self._modules:
+                total_fuel += module.total_fuel_requirement
+
+            self._total_fuel_requirement = total_fuel
+
+        return self._total_fuel_requirement
 
 
 class Computer(Module):
@@ -147,17 +310,89 @@ class Computer(Module):
         }
     }
 
-    def intcode(self, input_list):
+    def intcode(self, input_list, input_values=None, outputs=None, fuse=False, cache=None, tracer=None):
         """Processes a series of intcode instructions.
 
         Args:
-            input_list: A list of integers representing the intcode instructions to be processed.
+            input_list: A list of integers representing the intcode instructions to be processed, or an
+            `intcode_memory.PagedMemory` instance for programs which write beyond their own length, or an
+            `intcode_memory.TypedMemory` instance to store memory compactly as 64-bit integers.
+            input_values: An optional iterable of integers consumed by STORE instructions. If not provided,
+            the user is prompted for each value instead.
+            outputs: An optional list to which values from OUTPUT instructions are appended. If not provided,
+            output values are printed instead.
+            fuse: A boolean indicating whether to run the program with `intcode_analysis.FusedInterpreter`,
+            which decodes each instruction once and fuses common instruction pairs into superinstructions.
+            cache: An optional `result_cache.ResultCache`. If the same program has been run with the same input
+            values before, its cached final memory and outputs are used instead of running it again. Only lists
+            run with a finite `input_values` sequence are cached.
+            tracer: An optional `intcode_trace.TraceRecorder` which records every instruction executed. Tracing
+            cannot be combined with `fuse` or `cache`, since neither executes each instruction individually.
 
         Returns:
             A list resulting from processing each of the instructions in the provided intcode list.
 
+        Raises:
+            ValueError: An invalid instruction was detected, or `tracer` was combined with `fuse` or `cache`.
+            RuntimeError: A STORE instruction was reached after all of `input_values` had been consumed.
+        """
+
+        if tracer is not None and (fuse or cache is not None):
+            raise ValueError("Tracing requires every instruction to be executed individually, without fuse or cache.")
+
+        if cache is not None and input_values is not None and isinstance(input_list, list):
+            memory, cached_outputs = cache.run(self, input_list, input_values=input_values, fuse=fuse)
+            input_list[:] = memory
+            if outputs is None:
+                for value in cached_outputs:
+                    print(value)
+            else:
+                outputs.extend(cached_outputs)
+
+            return input_list
+
+        if input_values is not None:
+            input_values = iter(input_values)
+
+        with instrumentation.timer("computer.intcode"):
+            if fuse:
+                import intcode_analysis
+
+                intcode_analysis.FusedInterpreter(self).execute(
+                    input_list, input_values=input_values, outputs=outputs
+                )
+            else:
+                self.execute(input_list, input_values=input_values, outputs=outputs, tracer=tracer)
+
+        return input_list
+
+    def execute(self, input_list, index=0, input_values=None, outputs=None, max_steps=None, wait_for_input=False,
+                tracer=None):
+        """Executes intcode instructions in place from a given instruction until the program halts or pauses.
+
+        Unlike `intcode`, execution can be paused and later resumed from the returned instruction index, which
+        allows many programs to share a single thread by each running for a limited number of instructions at a time.
+
+        Args:
+            input_list: A list of integers representing the intcode program's memory. It is modified in place.
+            index: The index of the instruction from which to start executing.
+            input_values: An optional iterator of integers consumed by STORE instructions. If not provided,
+            the user is prompted for each value instead.
+            outputs: An optional list to which values from OUTPUT instructions are appended. If not provided,
+            output values are printed instead.
+            max_steps: An optional maximum number of instructions to execute before pausing.
+            wait_for_input: A boolean indicating whether to pause at a STORE instruction when `input_values` is
+            exhausted, rather than raising an exception.
+            tracer: An optional `intcode_trace.TraceRecorder` which records every instruction executed.
+
+        Returns:
+            A tuple containing the index of the next instruction to execute, the number of instructions executed,
+            and a boolean indicating whether the program has halted.
+
         Raises:
             ValueError: An invalid instruction was detected.
+            RuntimeError: A STORE instruction was reached after all of `input_values` had been consumed, and
+            `wait_for_input` is False.
         """
 
         def parse_instruction(my_inst):
@@ -172,9 +407,16 @@ class Computer(Module):
                 modes_ = []
             return op_code, modes_
 
-        index = 0
+        steps = 0
+        halted = True
         while index < len(input_list):
-            instruction, modes = parse_instruction(input_list[index])
+            if max_steps is not None and steps >= max_steps:
+                halted = False
+                break
+
+            steps += 1
+            raw_instruction = input_list[index]
+            instruction, modes = parse_instruction(raw_instruction)
 
             if instruction not in self.VALID_INSTRUCTIONS.keys():
                 raise ValueError(f"Invalid instruction at {index}")
@@ -185,7 +427,8 @@ class Computer(Module):
             output_param = inst_meta.get('output_param')
             parameters = []
             param_start_index = index + 1
-            for i, param in enumerate(input_list[param_start_index:param_start_index+parameter_count]):
+            raw_parameters = input_list[param_start_index:param_start_index+parameter_count]
+            for i, param in enumerate(raw_parameters):
                 # Default to mode 0 (position mode)
                 mode = modes[i] if i < len(modes) else 0
 
@@ -193,8 +436,10 @@ class Computer(Module):
                     param if mode == 1 or (output_param is not None and i == (output_param - 1)) else input_list[param]
                 )
 
+            written = None
+            next_index = index + parameter_count + 1
             if instruction == self.HALT:
-                break
+                next_index = None
             elif instruction in (self.ADD, self.MULT, self.LESS_THAN, self.EQUALS):
                 # Add, multiply, less than, and equals functions use the same parameter format
                 first, second, output = parameters
@@ -207,25 +452,49 @@ class Computer(Module):
                     input_list[output] = 1 if first < second else 0
                 elif instruction == self.EQUALS:
                     input_list[output] = 1 if first == second else 0
+                written = output
             elif instruction == self.STORE:
                 target = parameters[0]
-                value = int(input("Enter a value to store: "))
+                if input_values is None:
+                    value = int(input("Enter a value to store: "))
+                else:
+                    value = next(input_values, None)
+                    if value is None:
+                        if wait_for_input:
+                            # Pause on the STORE instruction itself, so it is retried when execution resumes
+                            steps -= 1
+                            halted = False
+                            break
+
+                        raise RuntimeError(f"No input value available for instruction at {index}")
 
                 input_list[target] = value
+                written = target
             elif instruction == self.OUTPUT:
                 value = parameters[0]
-                print(value)
+                if outputs is None:
+                    print(value)
+                else:
+                    outputs.append(value)
             elif instruction == self.JUMP_IF_TRUE:
                 value, target = parameters
                 if value != 0:
-                    index = target
-                    continue
+                    next_index = target
             elif instruction == self.JUMP_IF_FALSE:
                 value, target = parameters
                 if value == 0:
-                    index = target
-                    continue
+                    next_index = target
+
+            if tracer is not None:
+                tracer.record(
+                    index, raw_instruction, raw_parameters, written, input_list[written] if written is not None else None
+                )
 
-            index += parameter_count + 1
+            if next_index is None:
+                break
 
-        return input_list
+            index = next_index
+
+        instrumentation.increment("computer.steps", steps)
+
+        return index, steps, halted
@@ -1,4 +1,6 @@
+import instrumentation
 import spacecraft
+import wire_index
 
 
 class Coordinate(tuple):
@@ -28,7 +30,7 @@ class FuelManagement(spacecraft.Module):
         self.wires = []
         self._intersections = None
 
-    def add_wire(self, wire):
+    def add_wire(self, wire, normalize=False):
         """Adds a wire to the FuelManagement ship module.
 
         Given a wire instance or set of instructions indicating the path of a wire,
@@ -37,6 +39,7 @@ class FuelManagement(spacecraft.Module):
         Args:
             wire: A predefined instance of Wire, or a string or list containing instructions for creation
             of a new Wire instance to be added to the FuelManagement module.
+            normalize: A boolean indicating whether a Wire created from instructions should normalize its path.
 
         Raises:
             TypeError: An invalid value was provided for `wire`. Must be an instance of Wire or a str or list containing
@@ -46,7 +49,7 @@ class FuelManagement(spacecraft.Module):
         if isinstance(wire, Wire):
             self.wires.append(wire)
         elif isinstance(wire, str) or isinstance(wire, list):
-            self.wires.append(Wire(wire))
+            self.wires.append(Wire(wire, normalize=normalize))
         else:
             raise TypeError(
                 f"Invalid type for value `instructions`. Expected an instance of `Wire` or a `str` or `list` "
@@ -56,20 +59,16 @@ class FuelManagement(spacecraft.Module):
     def _find_intersections(self):
         intersections = []
 
-        already_processed = []
-        for wire in self.wires:
-            for segment1 in wire.segments:
-                for other_wire in self.wires:
-                    if other_wire is wire or other_wire in already_processed:
-                        # Skip if the wire is being compared to itself or has already been processed
-                        continue
+        for position, wire in enumerate(self.wires):
+            # Each pair of wires is only compared once, and only segments whose bounding boxes overlap are checked
+            for other_wire in self.wires[position + 1:]:
+                if other_wire is wire:
+                    continue
 
-                    for segment2 in other_wire.segments:
-                        intersection = segment1.intersects_at(segment2)
-                        if intersection is not None:
-                            intersections.append(intersection)
-
-            already_processed.append(wire)
+                for segment1, segment2 in wire.index.candidate_pairs(other_wire.index):
+                    intersection = segment1.intersects_at(segment2)
+                    if intersection is not None:
+                        intersections.append(intersection)
 
         # Remove the point of origin from the list of intersections
         while (0, 0) in intersections:
@@ -83,7 +82,11 @@ class FuelManagement(spacecraft.Module):
         """Returns a set of coordinates at which intersections of the FuelManagement module's wires occur."""
 
         if self._intersections is None:
-            self._intersections = self._find_intersections()
+            instrumentation.increment("fuel_management.intersections.cache_miss")
+            with instrumentation.timer("fuel_management.find_intersections"):
+                self._intersections = self._find_intersections()
+        else:
+            instrumentation.increment("fuel_management.intersections.cache_hit")
 
         return self._intersections
 
@@ -127,31 +130,82 @@ class FuelManagement(spacecraft.Module):
         Checks distance along each wire (following the path of the wire) to reach each intersection,
         and determines the shortest combined distance to reach an intersection.
 
+        Intersections which some wire never reaches have no combined distance, and are skipped.
+
         Returns:
-            An integer indicating the shortest combined distance along the wires to an intersection.
+            An integer indicating the shortest combined distance along the wires to an intersection, or None if
+            no intersection is reached by every wire.
         """
 
+        try:
+            import numpy as np
+        except ImportError:
+            np = None
+
+        if np is not None:
+            if not self.intersections:
+                return None
+
+            combined = self.step_distances(list(self.intersections))
+            # Points which some wire never reaches have no latency
+            reached = (combined >= 0).all(axis=0)
+            if not reached.any():
+                return None
+
+            return int(combined.sum(axis=0)[reached].min())
+
         min_distance = None
 
         for intersection in self.intersections:
-            combined_distance = 0
-            for wire in self.wires:
-                combined_distance += wire.distance_to_point(intersection)
+            distances = [wire.distance_to_point(intersection) for wire in self.wires]
+            if None in distances:
+                continue
 
+            combined_distance = sum(distances)
             if min_distance is None or combined_distance < min_distance:
                 min_distance = combined_distance
 
         return min_distance
 
+    def step_distances(self, points):
+        """Returns the distance along each wire to many points at once, using `wire_index.SegmentIndex`.
+
+        Args:
+            points: A sequence of (x, y) pairs, or an array with shape (n, 2).
+
+        Returns:
+            An int64 NumPy array with one row per wire and one column per point, containing the distance along the
+            wire to the point, or -1 where the wire never reaches the point.
+
+        Raises:
+            ImportError: NumPy is not installed.
+        """
+
+        import numpy as np
+
+        points = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+
+        return np.array([wire.index.distances_to_points(points) for wire in self.wires], dtype=np.int64).reshape(
+            len(self.wires), len(points)
+        )
+
 
 class Wire:
-    """A Wire object consisting of WireSegment objects."""
+    """A Wire object consisting of WireSegment objects.
+
+    A normalized wire keeps its path in the fewest possible segments: zero-length moves are dropped, and a move
+    continuing in the same direction as the previous one extends the last segment rather than adding a new one.
+    Moves which double back are never merged, so distances along the wire are the same whether or not it is
+    normalized.
+    """
 
-    def __init__(self, instructions=None):
+    def __init__(self, instructions=None, normalize=False):
         """Initialize a new Wire instance, creating WireSegments from any instructions provided.
 
         Args:
             instructions: An optional string or list containing a series of instructions indicating the wire's path.
+            normalize: A boolean indicating whether to merge consecutive moves in the same direction and drop
+            zero-length moves.
 
         Raises:
             TypeError: An invalid object type was provided for the `instructions` argument.
@@ -159,6 +213,8 @@ class Wire:
 
         self._end_position = (0, 0)  # Wire always starts from same origin
         self.segments = []
+        self.normalize = normalize
+        self._index = None
 
         if instructions is not None:
             if isinstance(instructions, str):
@@ -199,6 +255,19 @@ class Wire:
 
         return points
 
+    @property
+    def index(self):
+        """Returns a `wire_index.SegmentIndex` over the wire's segments, built when first needed after a change.
+
+        `segments` is a public list which may be modified directly, so the index is also rebuilt whenever it no
+        longer holds the same segments as the wire. Segments compare by identity, so the check is a fast C loop.
+        """
+
+        if self._index is None or self._index.segments != self.segments:
+            self._index = wire_index.SegmentIndex(self.segments)
+
+        return self._index
+
     def distance_to_point(self, point):
         """Returns an integer indicating the distance required to reach the specified point along the wire.
 
@@ -206,36 +275,53 @@ class Wire:
             point: A coordinate pair indicating the point for which distance along the wire should be calculated.
         """
 
-        if not isinstance(point, Coordinate):
-            point = Coordinate(*point)
-
-        total_length = 0
-        for segment in self.segments:
-            if segment.intersects_point(point):
-                if segment.orientation == WireSegment.HORIZONTAL:
-                    intersect_length = segment.length - abs(segment.end.x - point.x)
-                else:
-                    intersect_length = segment.length - abs(segment.end.y - point.y)
-
-                return total_length + intersect_length
-
-            total_length += segment.length
+        return self.index.distance_to_point(point)
 
     def add_segment(self, instruction):
         """Adds a new wire segment determined by an instruction input.
 
         Args:
-            instruction: A string indicating a single instruction (`U23`, `R42`, etc.) for the wire segment.
+            instruction: A string indicating a single instruction (`U23`, `R42`, etc.) for the wire segment, or a
+            tuple containing an already parsed (x, y) offset.
         """
 
-        offset_x, offset_y = self.parse_instruction(instruction)
+        if isinstance(instruction, tuple):
+            offset_x, offset_y = instruction
+        else:
+            offset_x, offset_y = self.parse_instruction(instruction)
         end_x, end_y = self.end_position
+        self._index = None
 
         new_x = end_x + offset_x
         new_y = end_y + offset_y
 
+        if self.normalize:
+            if offset_x == 0 and offset_y == 0:
+                return
+
+            if self.segments and self._continues_last_segment(offset_x, offset_y):
+                self.segments[-1] = WireSegment(self.segments[-1].start, (new_x, new_y))
+                return
+
         self.segments.append(WireSegment(self.end_position, (new_x, new_y)))
 
+    def _continues_last_segment(self, offset_x, offset_y):
+        last_segment = self.segments[-1]
+        last_x = last_segment.end.x - last_segment.start.x
+        last_y = last_segment.end.y - last_segment.start.y
+
+        # Collinear moves have no cross product, and moves in the same direction have a positive dot product
+        return last_x * offset_y == last_y * offset_x and last_x * offset_x + last_y * offset_y > 0
+
+    def normalized(self):
+        """Returns a new normalized Wire following the same path as this one."""
+
+        wire = Wire(normalize=True)
+        for segment in self.segments:
+            wire.add_segment((segment.end.x - segment.start.x, segment.end.y - segment.start.y))
+
+        return wire
+
     @staticmethod
     def parse_instruction(instruction: str):
         """Returns a coordinate offset determined by an instruction input.
@@ -334,6 +420,9 @@ class WireSegment:
         Raises:
             TypeError: An invalid value was provided for `other_segment`. This value must be an instance of WireSegment.
         """
+        if instrumentation.enabled:
+            instrumentation.increment("wire_segment.intersects_at")
+
         if not isinstance(other_segment, WireSegment):
             raise TypeError(
                 f"intersects_at may only accept another instance of WireSegment. Received {type(other_segment)}"
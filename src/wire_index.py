@@ -0,0 +1,329 @@
+import heapq
+import itertools
+
+
+def _segment_box(segment):
+    return (
+        min(segment.start[0], segment.end[0]),
+        min(segment.start[1], segment.end[1]),
+        max(segment.start[0], segment.end[0]),
+        max(segment.start[1], segment.end[1]),
+    )
+
+
+def _region_box(region):
+    x1, y1, x2, y2 = region
+    return min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2)
+
+
+def _first_visit_pieces(intervals):
+    """Splits intervals along lines into disjoint pieces, each belonging to the earliest interval covering it.
+
+    Args:
+        intervals: A list of (line, low, high, order) tuples, where `low` and `high` are the inclusive ends of the
+        interval along the line, and `order` is its position along the wire.
+
+    Returns:
+        A list of disjoint (line, low, high, order) tuples, sorted by line and then by low.
+    """
+
+    pieces = []
+    for line, group in itertools.groupby(sorted(intervals), key=lambda interval: interval[0]):
+        group = list(group)
+        breakpoints = sorted({low for _, low, _, _ in group} | {high + 1 for _, _, high, _ in group})
+        active = []
+        position = 0
+        for start, stop in zip(breakpoints, breakpoints[1:]):
+            while position < len(group) and group[position][1] <= start:
+                _, _, high, order = group[position]
+                heapq.heappush(active, (order, high))
+                position += 1
+
+            # Intervals which ended before this piece are only discarded once they are the earliest remaining
+            while active and active[0][1] < start:
+                heapq.heappop(active)
+
+            if not active:
+                continue
+
+            order = active[0][0]
+            if pieces and pieces[-1][0] == line and pieces[-1][2] == start - 1 and pieces[-1][3] == order:
+                pieces[-1] = (line, pieces[-1][1], stop - 1, order)
+            else:
+                pieces.append((line, start, stop - 1, order))
+
+    return pieces
+
+
+class _SortedPieces(object):
+    """Disjoint pieces of segments lying along parallel lines, sorted for vectorized lookups of points."""
+
+    def __init__(self, np, pieces):
+        lines = np.array([piece[0] for piece in pieces], dtype=np.int64)
+        lows = np.array([piece[1] for piece in pieces], dtype=np.int64)
+        self.highs = np.array([piece[2] for piece in pieces], dtype=np.int64)
+        self.orders = np.array([piece[3] for piece in pieces], dtype=np.int64)
+        self.lines = np.unique(lines)
+        self.ranks = np.searchsorted(self.lines, lines)
+        self.minimum = int(lows.min()) if pieces else 0
+        self.maximum = int(self.highs.max()) if pieces else -1
+
+        # Pieces are sorted by line and then by low, so combining the line's rank with the low gives a sorted key
+        self.span = self.maximum - self.minimum + 1
+        self.keys = self.ranks * self.span + (lows - self.minimum)
+
+    def lookup(self, np, across, along):
+        """Returns the order of the piece containing each point, or -1 where no piece contains the point."""
+
+        if not len(self.keys):
+            return np.full(len(across), -1, dtype=np.int64)
+
+        rank = np.minimum(np.searchsorted(self.lines, across), len(self.lines) - 1)
+        clipped = np.clip(along, self.minimum, self.maximum)
+        position = np.searchsorted(self.keys, rank * self.span + (clipped - self.minimum), side="right") - 1
+        found = np.maximum(position, 0)
+        valid = (
+            (self.lines[rank] == across) & (along == clipped) & (position >= 0)
+            & (self.ranks[found] == rank) & (self.highs[found] >= along)
+        )
+
+        return np.where(valid, self.orders[found], -1)
+
+
+def _overlaps(box1, box2):
+    return box1[0] <= box2[2] and box2[0] <= box1[2] and box1[1] <= box2[3] and box2[1] <= box1[3]
+
+
+class _Node(object):
+    __slots__ = ("box", "start", "stop", "left", "right")
+
+    def __init__(self, box, start, stop, left=None, right=None):
+        self.box = box
+        self.start = start
+        self.stop = stop
+        self.left = left
+        self.right = right
+
+
+class SegmentIndex(object):
+    """A bounding volume hierarchy over the segments of a wire, for answering region and point queries quickly.
+
+    Each node of the tree holds the bounding box of a contiguous run of the wire's segments, and is split in two
+    until runs are no longer than `leaf_size` segments. Consecutive segments of a wire are next to one another, so
+    splitting by position along the wire gives tight boxes, and queries can skip any run whose box misses the region
+    being searched. Because nodes are visited in order along the wire, the first segment found is also the first
+    segment reached when following the wire from its start.
+
+    Regions are given as (x1, y1, x2, y2) tuples of opposite corners, and include their edges.
+    """
+
+    def __init__(self, segments, leaf_size=8):
+        """Initializes a new SegmentIndex instance.
+
+        Args:
+            segments: A sequence of WireSegments, in order along the wire.
+            leaf_size: The maximum number of segments in each leaf of the tree.
+
+        Raises:
+            ValueError: A non-positive value was provided for `leaf_size`.
+        """
+
+        if leaf_size < 1:
+            raise ValueError(f"Leaves must hold at least one segment. Received {leaf_size}.")
+
+        self.segments = list(segments)
+        self.leaf_size = leaf_size
+        self.boxes = [_segment_box(segment) for segment in self.segments]
+
+        # The distance along the wire to the start of each segment
+        self.offsets = []
+        total_length = 0
+        for segment in self.segments:
+            self.offsets.append(total_length)
+            total_length += segment.length
+
+        self.root = self._build(0, len(self.segments)) if self.segments else None
+        self._distance_tables = None
+
+    def __len__(self):
+        return len(self.segments)
+
+    def _build(self, start, stop):
+        if stop - start <= self.leaf_size:
+            boxes = self.boxes[start:stop]
+            box = (
+                min(box[0] for box in boxes),
+                min(box[1] for box in boxes),
+                max(box[2] for box in boxes),
+                max(box[3] for box in boxes),
+            )
+            return _Node(box, start, stop)
+
+        middle = (start + stop) // 2
+        left = self._build(start, middle)
+        right = self._build(middle, stop)
+        box = (
+            min(left.box[0], right.box[0]),
+            min(left.box[1], right.box[1]),
+            max(left.box[2], right.box[2]),
+            max(left.box[3], right.box[3]),
+        )
+
+        return _Node(box, start, stop, left, right)
+
+    def _touching(self, box):
+        """Yields the index of each segment touching a bounding box, in order along the wire."""
+
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            if not _overlaps(node.box, box):
+                continue
+
+            if node.left is None:
+                for index in range(node.start, node.stop):
+                    if _overlaps(self.boxes[index], box):
+                        yield index
+            else:
+                # The right child is pushed first so that the left child, earlier along the wire, is visited first
+                stack.append(node.right)
+                stack.append(node.left)
+
+    def segments_in(self, region):
+        """Returns a list of the segments which touch a rectangular region, in order along the wire.
+
+        Args:
+            region: An (x1, y1, x2, y2) tuple containing the coordinates of two opposite corners of the region.
+        """
+
+        return [self.segments[index] for index in self._touching(_region_box(region))]
+
+    def first_touching(self, region):
+        """Returns the index of the first segment along the wire which touches a region, or None if none do.
+
+        Args:
+            region: An (x1, y1, x2, y2) tuple containing the coordinates of two opposite corners of the region.
+        """
+
+        return next(self._touching(_region_box(region)), None)
+
+    def passes_through(self, point):
+        """Returns a boolean indicating whether the wire passes through a point.
+
+        Args:
+            point: An (x, y) tuple containing the coordinates of the point.
+        """
+
+        return self.first_touching((point[0], point[1], point[0], point[1])) is not None
+
+    def distance_to_point(self, point):
+        """Returns the distance along the wire to the first time it reaches a point, or None if it never does.
+
+        Args:
+            point: An (x, y) tuple containing the coordinates of the point.
+        """
+
+        index = self.first_touching((point[0], point[1], point[0], point[1]))
+        if index is None:
+            return None
+
+        start = self.segments[index].start
+
+        return self.offsets[index] + abs(point[0] - start[0]) + abs(point[1] - start[1])
+
+    def _build_distance_tables(self, np):
+        horizontal = []
+        vertical = []
+        for order, segment in enumerate(self.segments):
+            (x1, y1), (x2, y2) = segment.start, segment.end
+            if y1 == y2:
+                horizontal.append((y1, min(x1, x2), max(x1, x2), order))
+            else:
+                vertical.append((x1, min(y1, y2), max(y1, y2), order))
+
+        return (
+            _SortedPieces(np, _first_visit_pieces(horizontal)),
+            _SortedPieces(np, _first_visit_pieces(vertical)),
+            np.array(self.offsets, dtype=np.int64),
+            np.array([segment.start for segment in self.segments], dtype=np.int64).reshape(-1, 2),
+        )
+
+    def distances_to_points(self, points):
+        """Returns the distance along the wire to the first time it reaches each of many points, as a NumPy array.
+
+        Horizontal and vertical segments are each split into disjoint pieces belonging to the earliest segment
+        covering them, and sorted by line and position along the line. Every point is then looked up at once with
+        `searchsorted`, and its distance found from the prefix sums of the segment lengths, so no Python code runs
+        per point. The sorted pieces are built the first time this is called.
+
+        Args:
+            points: A sequence of (x, y) pairs, or an array with shape (n, 2).
+
+        Returns:
+            An int64 array containing the distance to each point, or -1 for points the wire never reaches.
+
+        Raises:
+            ImportError: NumPy is not installed.
+        """
+
+        import numpy as np
+
+        if self._distance_tables is None:
+            self._distance_tables = self._build_distance_tables(np)
+        horizontal, vertical, offsets, starts = self._distance_tables
+
+        points = np.asarray(points, dtype=np.int64).reshape(-1, 2)
+        x, y = points[:, 0], points[:, 1]
+        distances = np.full(len(points), -1, dtype=np.int64)
+        for orders in (horizontal.lookup(np, y, x), vertical.lookup(np, x, y)):
+            found = orders >= 0
+            order = orders[found]
+            distance = offsets[order] + np.abs(x[found] - starts[order, 0]) + np.abs(y[found] - starts[order, 1])
+            current = distances[found]
+            distances[found] = np.where((current < 0) | (distance < current), distance, current)
+
+        return distances
+
+    def candidate_pairs(self, other):
+        """Yields each pair of segments, one from this index and one from another, whose bounding boxes overlap.
+
+        The two trees are descended together, so any pair of runs whose boxes don't overlap is skipped without
+        looking at the segments within them. Every pair of segments which intersect is among the pairs yielded.
+
+        Args:
+            other: The SegmentIndex of another wire.
+        """
+
+        if self.root is None or other.root is None:
+            return
+
+        stack = [(self.root, other.root)]
+        while stack:
+            node, other_node = stack.pop()
+            if not _overlaps(node.box, other_node.box):
+                continue
+
+            if node.left is None and other_node.left is None:
+                yield from self._leaf_pairs(node, other, other_node)
+            elif other_node.left is None or (
+                node.left is not None and node.stop - node.start >= other_node.stop - other_node.start
+            ):
+                stack.append((node.left, other_node))
+                stack.append((node.right, other_node))
+            else:
+                stack.append((node, other_node.left))
+                stack.append((node, other_node.right))
+
+    def _leaf_pairs(self, node, other, other_node):
+        other_indices = [
+            index for index in range(other_node.start, other_node.stop) if _overlaps(other.boxes[index], node.box)
+        ]
+        for index in range(node.start, node.stop):
+            box = self.boxes[index]
+            if not _overlaps(box, other_node.box):
+                continue
+
+            segment = self.segments[index]
+            for other_index in other_indices:
+                if _overlaps(box, other.boxes[other_index]):
+                    yield segment, other.segments[other_index]
@@ -0,0 +1,40 @@
+import json
+
+import pytest
+
+import benchmark
+
+
+def test_discover_parts_finds_each_part():
+    parts = [(day, part) for day, part, _ in benchmark.discover_parts()]
+    assert (4, "part1") in parts
+    assert (4, "part2") in parts
+    assert parts == sorted(parts)
+
+
+def test_discover_parts_can_filter_days():
+    assert {day for day, _, _ in benchmark.discover_parts(days={4})} == {4}
+
+
+def test_measure_reports_timings_and_memory():
+    calls = []
+
+    def function():
+        calls.append(bytearray(100000))
+        print("discarded")
+
+    result = benchmark.measure(function, repeat=3, warmup=2)
+    assert len(calls) == 6
+    assert 0 <= result["wall_min"] <= result["wall_mean"] <= result["wall_max"]
+    assert result["peak_memory"] >= 100000
+
+
+def test_measure_raises_exception_with_bad_repeat():
+    with pytest.raises(ValueError):
+        benchmark.measure(lambda: None, repeat=0)
+
+
+def test_main_can_output_json(capsys):
+    benchmark.main(["4", "--repeat", "1", "--warmup", "0", "--format", "json"])
+    results = json.loads(capsys.readouterr().out)
+    assert [(result["day"], result["part"]) for result in results] == [(4, "part1"), (4, "part2")]
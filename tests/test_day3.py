@@ -0,0 +1,19 @@
+from unittest import mock
+
+import day3
+
+
+def test_solver_context_builds_circuit_once(monkeypatch):
+    mock_get_inputs = mock.MagicMock(
+        return_value=["R75,D30,R83,U83,L12,D49,R71,U7,L72", "U62,R66,U55,R34,D71,R55,D58,R83"]
+    )
+    monkeypatch.setattr(day3, "get_inputs", mock_get_inputs)
+    mock_print = mock.MagicMock()
+    monkeypatch.setattr('builtins.print', mock_print)
+
+    context = day3.SolverContext()
+    day3.part1(context)
+    day3.part2(context)
+
+    mock_get_inputs.assert_called_once_with()
+    assert mock_print.call_args_list == [mock.call(159), mock.call(610)]
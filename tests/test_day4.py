@@ -23,3 +23,114 @@ def test_can_get_correct_result_from_meets_criteria(test_input, expected):
 )
 def test_can_get_correct_result_from_password_meets_criteria(test_input, expected):
     assert day4.password_meets_criteria(test_input) == expected
+
+
+@pytest.mark.parametrize(
+    "rules, test_input, expected", (
+            (day4.PasswordRules(day4.run_is_pair), 111111, True),
+            (day4.PasswordRules(day4.run_is_exact_pair), 111111, False),
+            (day4.PasswordRules(day4.run_is_exact_pair), 111122, True),
+            (day4.PasswordRules(day4.run_is_pair, non_decreasing=False), 223450, True),
+            (day4.PasswordRules(), 123789, True),
+            (day4.PasswordRules(), 123780, False),
+            (day4.PasswordRules(day4.run_is_pair) & day4.PasswordRules(lambda length: length == 3), 111223, True),
+            (day4.PasswordRules(day4.run_is_pair) & day4.PasswordRules(lambda length: length == 3), 112233, False),
+    )
+)
+def test_password_rules(rules, test_input, expected):
+    assert rules(test_input) == expected
+
+
+@pytest.mark.parametrize("rules", (day4.PasswordRules(non_decreasing=False), day4.INCOMPLETE_CRITERIA, day4.CRITERIA))
+def test_password_rules_raise_exception_with_negative_password(rules):
+    with pytest.raises(ValueError):
+        rules(-5)
+
+
+@pytest.mark.parametrize("test_input", (-111111, -5))
+def test_criteria_raise_exception_with_negative_password(test_input):
+    with pytest.raises(ValueError):
+        day4.password_meets_incomplete_criteria(test_input)
+
+    with pytest.raises(ValueError):
+        day4.password_meets_criteria(test_input)
+
+
+@pytest.mark.parametrize("test_input", ("111111", 111.0, None))
+def test_criteria_raise_exception_with_bad_input(test_input):
+    with pytest.raises(TypeError):
+        day4.password_meets_incomplete_criteria(test_input)
+
+    with pytest.raises(TypeError):
+        day4.password_meets_criteria(test_input)
+
+
+@pytest.mark.parametrize(
+    "range_min, range_max", (
+            (0, 3000),
+            (99, 1001),
+            (183564, 190000),
+            (111, 112),
+            (5, 5),
+    )
+)
+def test_candidate_passwords_match_non_decreasing_numbers_in_range(range_min, range_max):
+    expected = [x for x in range(range_min, range_max) if list(str(x)) == sorted(str(x))]
+    assert list(day4.candidate_passwords(range_min, range_max)) == expected
+
+
+class TestPasswordAutomaton:
+    @pytest.mark.parametrize(
+        "exact_pair, criteria", (
+                (False, day4.password_meets_incomplete_criteria),
+                (True, day4.password_meets_criteria),
+        )
+    )
+    def test_accepts_agrees_with_criteria(self, exact_pair, criteria):
+        automaton = day4.PasswordAutomaton(exact_pair=exact_pair)
+        for password in range(0, 20000):
+            assert automaton.accepts(password) == criteria(password)
+
+    @pytest.mark.parametrize(
+        "exact_pair, criteria, range_min, range_max", (
+                (False, day4.password_meets_incomplete_criteria, 0, 12345),
+                (True, day4.password_meets_criteria, 0, 12345),
+                (False, day4.password_meets_incomplete_criteria, 183564, 200000),
+                (True, day4.password_meets_criteria, 183564, 200000),
+                (True, day4.password_meets_criteria, 112233, 112234),
+                (True, day4.password_meets_criteria, 500, 400),
+        )
+    )
+    def test_count_agrees_with_criteria(self, exact_pair, criteria, range_min, range_max):
+        automaton = day4.PasswordAutomaton(exact_pair=exact_pair)
+        expected = sum(1 for password in range(range_min, range_max) if criteria(password))
+        assert automaton.count(range_min, range_max) == expected
+
+    def test_can_count_wide_ranges(self):
+        automaton = day4.PasswordAutomaton()
+        assert automaton.count(10 ** 17, 10 ** 18) > 0
+
+
+class TestVectorizedCriteria:
+    @pytest.fixture(autouse=True)
+    def numpy(self):
+        return pytest.importorskip("numpy")
+
+    @pytest.mark.parametrize(
+        "exact_pair, criteria", (
+                (False, day4.password_meets_incomplete_criteria),
+                (True, day4.password_meets_criteria),
+        )
+    )
+    def test_password_mask_agrees_with_criteria(self, exact_pair, criteria):
+        passwords = list(range(0, 20000)) + list(day4.candidate_passwords(10 ** 8, 2 * 10 ** 8))
+        expected = [criteria(password) for password in passwords]
+        assert day4.password_mask(passwords, exact_pair=exact_pair).tolist() == expected
+
+    @pytest.mark.parametrize("exact_pair, expected", ((False, 1610), (True, 1104)))
+    def test_count_passwords_vectorized(self, exact_pair, expected):
+        assert day4.count_passwords_vectorized(exact_pair=exact_pair, chunk_size=100000) == expected
+
+    def test_matching_passwords(self):
+        expected = [password for password in range(100, 2000) if day4.password_meets_criteria(password)]
+        assert day4.matching_passwords(100, 2000, exact_pair=True, chunk_size=300).tolist() == expected
@@ -0,0 +1,88 @@
+import io
+import json
+
+import pytest
+
+import instrumentation
+import spacecraft
+import systems
+
+
+@pytest.fixture(autouse=True)
+def clean_instrumentation():
+    instrumentation.disable()
+    instrumentation.reset()
+    yield
+    instrumentation.disable()
+    instrumentation.reset()
+
+
+def test_nothing_is_collected_when_disabled():
+    instrumentation.increment("counter")
+    instrumentation.record_max("maximum", 3)
+    with instrumentation.timer("timer"):
+        pass
+
+    assert instrumentation.snapshot() == {"counters": {}, "maximums": {}, "timers": {}}
+
+
+def test_can_collect_values():
+    with instrumentation.collect() as stats:
+        instrumentation.increment("counter")
+        instrumentation.increment("counter", 4)
+        instrumentation.record_max("maximum", 3)
+        instrumentation.record_max("maximum", 1)
+        with instrumentation.timer("timer"):
+            pass
+
+    assert not instrumentation.enabled
+    assert stats["counters"] == {"counter": 5}
+    assert stats["maximums"] == {"maximum": 3}
+    assert stats["timers"]["timer"]["count"] == 1
+
+
+def test_nested_records_maximum_depth():
+    with instrumentation.collect() as stats:
+        with instrumentation.nested("depth"):
+            with instrumentation.nested("depth"):
+                pass
+            with instrumentation.nested("depth"):
+                pass
+
+    assert stats["maximums"] == {"depth": 2}
+
+
+def test_subsystems_report_when_enabled():
+    with instrumentation.collect() as stats:
+        spacecraft.Computer().intcode([1, 0, 0, 0, 99])
+        spacecraft.Fuel(100756).fuel_requirement
+        fm = systems.FuelManagement()
+        fm.add_wire("U1,R2")
+        fm.add_wire("R1,U2")
+        fm.intersections
+        fm.intersections
+
+    assert stats["counters"]["computer.steps"] == 2
+    assert stats["counters"]["wire_segment.intersects_at"] == 2
+    assert stats["counters"]["fuel_management.intersections.cache_miss"] == 1
+    assert stats["counters"]["fuel_management.intersections.cache_hit"] == 1
+    assert stats["maximums"]["fuel.recursion_depth"] > 1
+    assert stats["timers"]["computer.intcode"]["count"] == 1
+
+
+@pytest.mark.parametrize("output_format", ("table", "json"))
+def test_dump(output_format):
+    with instrumentation.collect() as stats:
+        instrumentation.increment("counter")
+
+    out_file = io.StringIO()
+    instrumentation.dump(out_file, output_format=output_format, stats=stats)
+    if output_format == "json":
+        assert json.loads(out_file.getvalue())["counters"] == {"counter": 1}
+    else:
+        assert "counter" in out_file.getvalue()
+
+
+def test_dump_raises_exception_with_bad_format():
+    with pytest.raises(ValueError):
+        instrumentation.dump(io.StringIO(), output_format="xml")
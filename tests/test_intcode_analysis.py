@@ -0,0 +1,80 @@
+from unittest import mock
+
+import pytest
+
+import intcode_analysis
+import spacecraft
+
+COMPARISON_PROGRAM = [
+    3, 21, 1008, 21, 8, 20, 1005, 20, 22, 107, 8, 21, 20, 1006, 20, 31,
+    1106, 0, 36, 98, 0, 0, 1002, 21, 125, 20, 4, 20, 1105, 1, 46, 104,
+    999, 1105, 1, 46, 1101, 1000, 1, 20, 4, 20, 1105, 1, 46, 98, 99
+]
+COUNTDOWN_PROGRAM = [1101, 0, 50, 30, 1001, 30, -1, 30, 1005, 30, 4, 4, 30, 99] + [0] * 20
+
+
+def test_decode():
+    instruction = intcode_analysis.decode([1002, 4, 3, 4, 33], 0)
+    assert instruction == intcode_analysis.Instruction(0, spacecraft.Computer.MULT, (0, 1, 0), (4, 3, 4))
+    assert instruction.size == 4
+    assert str(instruction) == "     0: MULT          [4], 3, [4]"
+
+
+def test_decode_raises_exception_with_invalid_instruction():
+    with pytest.raises(ValueError):
+        intcode_analysis.decode([0, 99], 0)
+
+
+def test_disassemble_follows_static_jumps_and_stops_at_halt():
+    addresses = [instruction.address for instruction in intcode_analysis.disassemble(COMPARISON_PROGRAM)]
+    assert addresses == [0, 2, 6, 9, 13, 16, 22, 26, 28, 31, 33, 36, 40, 42, 46]
+
+
+def test_basic_blocks_split_at_jumps_and_targets():
+    blocks = intcode_analysis.basic_blocks(COUNTDOWN_PROGRAM)
+    assert [[instruction.address for instruction in block] for block in blocks] == [[0], [4, 8], [11, 13]]
+
+
+def test_count_sequences():
+    sequences = intcode_analysis.count_sequences(COUNTDOWN_PROGRAM)
+    assert sequences[(spacecraft.Computer.ADD, spacecraft.Computer.JUMP_IF_TRUE)] == 1
+    assert sequences[(spacecraft.Computer.OUTPUT, spacecraft.Computer.HALT)] == 1
+
+
+class TestFusedInterpreter:
+    @pytest.mark.parametrize("prompt_input, expected", ((6, 999), (8, 1000), (28, 1001)))
+    def test_matches_unfused_interpreter(self, prompt_input, expected):
+        unfused_outputs, fused_outputs = [], []
+        unfused = spacecraft.Computer().intcode(list(COMPARISON_PROGRAM), [prompt_input], unfused_outputs)
+        fused = spacecraft.Computer().intcode(list(COMPARISON_PROGRAM), [prompt_input], fused_outputs, fuse=True)
+
+        assert fused == unfused
+        assert fused_outputs == unfused_outputs == [expected]
+
+    def test_fuses_compare_and_jump_and_loop_counters(self):
+        interpreter = intcode_analysis.FusedInterpreter()
+        outputs = []
+        index, steps, halted = interpreter.execute(list(COUNTDOWN_PROGRAM), outputs=outputs)
+
+        assert halted
+        assert outputs == [0]
+        assert steps == 1 + 50 * 2 + 2
+        assert interpreter.fused_count == 1
+
+    def test_falls_back_when_code_is_modified(self):
+        # Rewrites the operand of the already decoded OUTPUT at address 0, then loops back to it once
+        program = [104, 5, 1101, 0, 7, 1, 1007, 21, 1, 22, 1101, 0, 1, 21, 1005, 22, 0, 99, 0, 0, 0, 0, 0]
+        unfused_outputs, fused_outputs = [], []
+        unfused = spacecraft.Computer().intcode(list(program), outputs=unfused_outputs)
+        fused = spacecraft.Computer().intcode(list(program), outputs=fused_outputs, fuse=True)
+
+        assert fused == unfused
+        assert fused_outputs == unfused_outputs == [5, 7]
+
+    def test_can_prompt_for_input_and_print(self, monkeypatch):
+        monkeypatch.setattr('builtins.input', mock.MagicMock(return_value="7"))
+        mock_print = mock.MagicMock()
+        monkeypatch.setattr('builtins.print', mock_print)
+
+        spacecraft.Computer().intcode([3, 0, 4, 0, 99], fuse=True)
+        mock_print.assert_called_once_with(7)
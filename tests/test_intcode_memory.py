@@ -0,0 +1,156 @@
+import array
+
+import pytest
+
+import intcode_memory
+import spacecraft
+
+
+def test_unwritten_addresses_read_as_zero_without_allocating_pages():
+    memory = intcode_memory.PagedMemory([1, 2, 3], page_size=4)
+    assert memory[1] == 2
+    assert memory[10 ** 12] == 0
+    assert memory.pages_allocated == 0
+    assert len(memory) == 3
+
+
+def test_writes_allocate_pages_on_demand():
+    memory = intcode_memory.PagedMemory(page_size=4)
+    memory[10 ** 12] = 7
+    assert memory[10 ** 12] == 7
+    assert memory.pages_allocated == 1
+    assert len(memory) == 10 ** 12 + 1
+
+
+def test_base_image_is_never_modified():
+    base = (1, 2, 3, 4, 5, 6)
+    memory = intcode_memory.PagedMemory(base, page_size=4)
+    memory[1] = 20
+    assert base == (1, 2, 3, 4, 5, 6)
+    assert memory.to_list() == [1, 20, 3, 4, 5, 6]
+    assert memory.pages_allocated == 1
+
+
+def test_page_promoted_to_python_ints_on_overflow():
+    memory = intcode_memory.PagedMemory([1, 2], page_size=4)
+    memory[0] = 5
+    assert isinstance(memory._pages[0], array.array)
+    memory[1] = 2 ** 70
+    assert memory.to_list() == [5, 2 ** 70]
+    assert isinstance(memory._pages[0], list)
+
+
+def test_slices_are_bounded_by_length():
+    memory = intcode_memory.PagedMemory([1, 2, 3, 4, 5], page_size=2)
+    memory[2] = 30
+    assert memory[1:4] == [2, 30, 4]
+    assert memory[3:10] == [4, 5]
+
+
+@pytest.mark.parametrize("page_size", [0, 3, -4])
+def test_invalid_page_size_raises_exception(page_size):
+    with pytest.raises(ValueError):
+        intcode_memory.PagedMemory(page_size=page_size)
+
+
+def test_negative_address_raises_exception():
+    memory = intcode_memory.PagedMemory([1])
+    with pytest.raises(IndexError):
+        memory[-1]
+    with pytest.raises(IndexError):
+        memory[-1] = 1
+
+
+@pytest.mark.parametrize("fuse", [False, True])
+def test_intcode_writes_far_beyond_program_length(fuse):
+    memory = intcode_memory.PagedMemory([1101, 5, 6, 10 ** 9, 4, 10 ** 9, 99], page_size=16)
+    outputs = []
+    spacecraft.Computer().intcode(memory, outputs=outputs, fuse=fuse)
+    assert memory[10 ** 9] == 11
+    assert outputs == [11]
+    assert memory.pages_allocated == 1
+
+
+def test_intcode_on_shared_base_image_matches_list():
+    program = (1, 9, 10, 3, 2, 3, 11, 0, 99, 30, 40, 50)
+    memory = intcode_memory.PagedMemory(program, page_size=4)
+    spacecraft.Computer().intcode(memory)
+    assert memory == spacecraft.Computer().intcode(list(program))
+    assert program == (1, 9, 10, 3, 2, 3, 11, 0, 99, 30, 40, 50)
+
+
+def run_on_shared_memory(name, length):
+    from multiprocessing import shared_memory
+
+    block = shared_memory.SharedMemory(name=name)
+    memory = intcode_memory.TypedMemory(buffer=block.buf, length=length)
+    spacecraft.Computer().intcode(memory)
+    memory.release()
+    block.close()
+
+
+class TestTypedMemory:
+    def test_values_are_packed(self):
+        memory = intcode_memory.TypedMemory([1, 2, 3])
+        assert isinstance(memory._values, array.array)
+        assert not memory.promoted
+        assert memory.to_list() == [1, 2, 3]
+        assert memory[1:] == [2, 3]
+
+    def test_values_too_large_start_promoted(self):
+        memory = intcode_memory.TypedMemory([1, 2 ** 64])
+        assert memory.promoted
+        assert memory.to_list() == [1, 2 ** 64]
+
+    @pytest.mark.parametrize("program, expected", [
+        ([1002, 5, 3, 5, 99, 2 ** 62], [1002, 5, 3, 5, 99, 3 * 2 ** 62]),
+        ([1001, 5, 1, 5, 99, 2 ** 63 - 1], [1001, 5, 1, 5, 99, 2 ** 63]),
+        ([1001, 5, -1, 5, 99, -2 ** 63], [1001, 5, -1, 5, 99, -2 ** 63 - 1]),
+    ])
+    def test_overflow_promotes_to_python_ints(self, program, expected):
+        memory = intcode_memory.TypedMemory(program)
+        spacecraft.Computer().intcode(memory)
+        assert memory.promoted
+        assert memory == expected
+
+    def test_intcode_within_64_bits_stays_packed(self):
+        program = [1, 9, 10, 3, 2, 3, 11, 0, 99, 30, 40, 50]
+        memory = intcode_memory.TypedMemory(program)
+        spacecraft.Computer().intcode(memory)
+        assert not memory.promoted
+        assert memory == spacecraft.Computer().intcode(program.copy())
+
+    def test_runs_in_place_on_numpy_buffer(self):
+        np = pytest.importorskip("numpy")
+        values = np.array([1, 0, 0, 0, 99], dtype=np.int64)
+        spacecraft.Computer().intcode(intcode_memory.TypedMemory(buffer=values))
+        assert values.tolist() == [2, 0, 0, 0, 99]
+
+    def test_promotion_detaches_from_buffer(self):
+        values = array.array("q", [1001, 5, 1, 5, 99, 2 ** 63 - 1])
+        memory = intcode_memory.TypedMemory(buffer=values)
+        spacecraft.Computer().intcode(memory)
+        assert memory.promoted
+        assert memory[5] == 2 ** 63
+        assert values[5] == 2 ** 63 - 1
+        values.append(0)  # The buffer is no longer exported, so it can be resized
+
+    def test_values_and_buffer_raises_exception(self):
+        with pytest.raises(ValueError):
+            intcode_memory.TypedMemory([1], buffer=array.array("q", [1]))
+
+    def test_worker_process_runs_on_shared_memory(self):
+        import concurrent.futures
+
+        program = [1, 9, 10, 3, 2, 3, 11, 0, 99, 30, 40, 50]
+        block = intcode_memory.TypedMemory(program).share()
+        try:
+            with concurrent.futures.ProcessPoolExecutor(max_workers=1) as executor:
+                executor.submit(run_on_shared_memory, block.name, len(program)).result()
+
+            shared = intcode_memory.TypedMemory(buffer=block.buf, length=len(program))
+            assert shared == spacecraft.Computer().intcode(program.copy())
+            shared.release()
+        finally:
+            block.close()
+            block.unlink()
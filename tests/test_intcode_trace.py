@@ -0,0 +1,85 @@
+import pytest
+
+import intcode_trace
+import spacecraft
+
+COUNTDOWN_PROGRAM = [1101, 0, 3, 30, 1001, 30, -1, 30, 1005, 30, 4, 4, 30, 99] + [0] * 20
+
+
+def test_records_every_executed_instruction():
+    tracer = intcode_trace.TraceRecorder()
+    spacecraft.Computer().intcode([1002, 4, 3, 4, 33], tracer=tracer)
+    assert list(intcode_trace.read_trace(tracer)) == [
+        intcode_trace.TraceRecord(0, 1002, (4, 3, 4), (4, 99)),
+        intcode_trace.TraceRecord(4, 99, (), None),
+    ]
+
+
+def test_records_jumps_inputs_and_outputs():
+    tracer = intcode_trace.TraceRecorder()
+    spacecraft.Computer().intcode([3, 10, 1005, 10, 7, 104, 0, 4, 10, 99, 0], input_values=[5], outputs=[], tracer=tracer)
+    records = list(intcode_trace.read_trace(tracer))
+    assert [record.pc for record in records] == [0, 2, 7, 9]
+    assert [record.opcode for record in records] == [3, 5, 4, 99]
+    assert records[0].write == (10, 5)
+
+
+def test_records_instruction_as_executed_when_it_overwrites_itself():
+    tracer = intcode_trace.TraceRecorder()
+    spacecraft.Computer().intcode([1101, 49, 50, 0], tracer=tracer)
+    assert list(intcode_trace.read_trace(tracer)) == [intcode_trace.TraceRecord(0, 1101, (49, 50, 0), (0, 99))]
+
+
+@pytest.mark.parametrize("chunk_size", [1, 5, 1 << 16])
+def test_trace_is_the_same_whatever_the_chunk_size(chunk_size):
+    tracer = intcode_trace.TraceRecorder(chunk_size=chunk_size)
+    spacecraft.Computer().intcode(COUNTDOWN_PROGRAM.copy(), outputs=[], tracer=tracer)
+    records = list(intcode_trace.read_trace(tracer))
+    assert [record.pc for record in records] == [0] + [4, 8] * 3 + [11, 13]
+    assert [record.write for record in records if record.opcode == 1] == [(30, 3), (30, 2), (30, 1), (30, 0)]
+
+
+def test_ring_buffer_keeps_most_recent_chunks():
+    tracer = intcode_trace.TraceRecorder(max_chunks=2, chunk_size=1)
+    spacecraft.Computer().intcode(COUNTDOWN_PROGRAM.copy(), outputs=[], tracer=tracer)
+    tracer.flush()
+    assert tracer.records == 9
+    assert [record.pc for record in intcode_trace.read_trace(tracer)] == [11, 13]
+
+
+def test_values_too_large_for_64_bits():
+    tracer = intcode_trace.TraceRecorder()
+    spacecraft.Computer().intcode([1102, 2 ** 40, 2 ** 40, 5, 99, 0], tracer=tracer)
+    tracer.flush()
+    record, _ = intcode_trace.read_trace(tracer)
+    assert record.write == (5, 2 ** 80)
+
+
+def test_trace_file_round_trip(tmp_path):
+    path = str(tmp_path / "countdown.trace")
+    with intcode_trace.TraceRecorder(path, chunk_size=4) as tracer:
+        spacecraft.Computer().intcode(COUNTDOWN_PROGRAM.copy(), outputs=[], tracer=tracer)
+
+    memory_tracer = intcode_trace.TraceRecorder()
+    spacecraft.Computer().intcode(COUNTDOWN_PROGRAM.copy(), outputs=[], tracer=memory_tracer)
+    assert list(intcode_trace.read_trace(path)) == list(intcode_trace.read_trace(memory_tracer))
+
+
+@pytest.mark.parametrize("content", [b"not a trace", intcode_trace.MAGIC + b"\x00\x01"])
+def test_read_trace_raises_exception_with_invalid_file(tmp_path, content):
+    path = tmp_path / "invalid.trace"
+    path.write_bytes(content)
+    with pytest.raises(ValueError):
+        list(intcode_trace.read_trace(str(path)))
+
+
+@pytest.mark.parametrize("kwargs", [{"chunk_size": 0}, {"max_chunks": 0}, {"max_chunks": 1, "path": "trace"}])
+def test_invalid_arguments_raise_exception(kwargs):
+    with pytest.raises(ValueError):
+        intcode_trace.TraceRecorder(**kwargs)
+
+
+@pytest.mark.parametrize("kwargs", [{"fuse": True}, {"cache": object()}])
+def test_tracing_cannot_be_combined_with_fuse_or_cache(kwargs):
+    with pytest.raises(ValueError):
+        spacecraft.Computer().intcode([99], tracer=intcode_trace.TraceRecorder(), **kwargs)
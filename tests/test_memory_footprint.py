@@ -0,0 +1,21 @@
+import os
+
+import pytest
+
+import benchmark
+
+# Realistic scales (e.g. a million segments) are slow under tracemalloc, so the default is kept small. Set
+# MEMORY_BENCHMARK_SCALE to check the footprints at full size.
+SCALE = int(os.environ.get("MEMORY_BENCHMARK_SCALE", 10000))
+
+
+@pytest.mark.parametrize("name", sorted(benchmark.MEMORY_BENCHMARKS))
+def test_memory_footprint_within_threshold(name):
+    result, = benchmark.run_memory(scale=SCALE, names={name})
+    assert result["within_threshold"], (
+        f"{name} uses {result['bytes_per_item']:.1f} bytes per item, exceeding the threshold of {result['threshold']}"
+    )
+
+
+def test_measure_footprint():
+    assert benchmark.measure_footprint(lambda count: [bytearray(1000) for _ in range(count)], 1000) >= 1000
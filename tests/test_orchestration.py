@@ -0,0 +1,75 @@
+import pytest
+
+import orchestration
+
+AMPLIFIER_PROGRAM = [3, 15, 3, 16, 1002, 16, 10, 16, 1, 16, 15, 15, 4, 15, 99, 0, 0]
+FEEDBACK_PROGRAM = [
+    3, 26, 1001, 26, -4, 26, 3, 27, 1002, 27, 2, 27, 1, 27, 26, 27, 4, 27, 1001, 28, -1, 28, 1005, 28, 6, 99, 0, 0, 5
+]
+
+
+class TestScheduler:
+    @pytest.mark.parametrize("slice_size", (1, 3, 1000))
+    def test_can_run_pipeline(self, slice_size):
+        scheduler = orchestration.Scheduler(slice_size=slice_size)
+        machines = scheduler.pipeline(AMPLIFIER_PROGRAM, [[4, 0], [3], [2], [1], [0]])
+        scheduler.run_until_complete()
+
+        assert machines[-1].outputs == [43210]
+        assert all(machine.halted for machine in machines)
+
+    @pytest.mark.parametrize("slice_size", (1, 3, 1000))
+    def test_can_run_feedback_loop(self, slice_size):
+        scheduler = orchestration.Scheduler(slice_size=slice_size)
+        machines = scheduler.pipeline(FEEDBACK_PROGRAM, [[9, 0], [8], [7], [6], [5]], feedback=True)
+        scheduler.run_until_complete()
+
+        assert machines[-1].outputs[-1] == 139629729
+
+    def test_can_run_many_machines(self):
+        scheduler = orchestration.Scheduler(slice_size=5)
+        chains = [scheduler.pipeline(FEEDBACK_PROGRAM, [[9, 0], [8], [7], [6], [5]], feedback=True) for _ in range(50)]
+        scheduler.run_until_complete()
+
+        assert all(chain[-1].outputs[-1] == 139629729 for chain in chains)
+
+    def test_does_not_modify_program(self):
+        program = [1, 0, 0, 0, 99]
+        scheduler = orchestration.Scheduler()
+        machine = scheduler.add_machine(program)
+        scheduler.run_until_complete()
+
+        assert machine.memory == [2, 0, 0, 0, 99]
+        assert program == [1, 0, 0, 0, 99]
+
+    def test_can_send_inputs_before_running(self):
+        scheduler = orchestration.Scheduler()
+        machine = scheduler.add_machine([3, 0, 4, 0, 99])
+        machine.send(42)
+        scheduler.run_until_complete()
+
+        assert machine.outputs == [42]
+
+    def test_raises_exception_when_deadlocked(self):
+        scheduler = orchestration.Scheduler()
+        scheduler.pipeline([3, 0, 4, 0, 99], [[], []], feedback=True)
+        with pytest.raises(RuntimeError):
+            scheduler.run_until_complete()
+
+    def test_raises_exception_when_last_other_machine_halts_while_waiting(self):
+        scheduler = orchestration.Scheduler()
+        scheduler.add_machine([3, 0, 4, 0, 99])
+        scheduler.add_machine([99])
+        with pytest.raises(RuntimeError):
+            scheduler.run_until_complete()
+
+    def test_raises_exception_when_waiting_on_halted_machine_with_unread_outputs(self):
+        scheduler = orchestration.Scheduler()
+        scheduler.add_machine([3, 0, 4, 0, 99])
+        scheduler.add_machine([104, 1, 99]).connect(scheduler.add_machine([99]))
+        with pytest.raises(RuntimeError):
+            scheduler.run_until_complete()
+
+    def test_raises_exception_with_bad_slice_size(self):
+        with pytest.raises(ValueError):
+            orchestration.Scheduler(slice_size=0)
@@ -0,0 +1,160 @@
+import os
+import sys
+
+import pytest
+
+import puzzle_inputs
+
+
+@pytest.fixture()
+def inputs_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "inputs"
+    directory.mkdir()
+    monkeypatch.setattr(puzzle_inputs, "INPUTS_DIR", str(directory))
+    return directory
+
+
+@pytest.fixture()
+def cache_dir(tmp_path):
+    return str(tmp_path / "cache")
+
+
+@pytest.fixture(params=(True, False), ids=("numpy", "without_numpy"))
+def use_numpy(request, monkeypatch):
+    if request.param:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setitem(sys.modules, "numpy", None)
+
+    return request.param
+
+
+def test_input_path():
+    assert puzzle_inputs.input_path("wire_paths.txt") == os.path.join(puzzle_inputs.INPUTS_DIR, "wire_paths.txt")
+
+
+@pytest.mark.parametrize(
+    "test_input, expected", (
+            ("1,0,0,3,99\n", [1, 0, 0, 3, 99]),
+            ("12\n14\n1969\n", [12, 14, 1969]),
+            ("-1,2,-3", [-1, 2, -3]),
+            ("", []),
+            ("\n", []),
+            ("  ", []),
+    )
+)
+def test_load_ints(inputs_dir, cache_dir, use_numpy, test_input, expected):
+    (inputs_dir / "test.txt").write_text(test_input)
+    assert puzzle_inputs.load_ints("test.txt", cache_dir=cache_dir) == expected
+    assert puzzle_inputs.load_ints("test.txt", cache_dir=cache_dir) == expected
+
+
+@pytest.mark.parametrize("test_input", ("1,,2", "1,2,\n"))
+def test_load_ints_raises_exception_with_empty_field(inputs_dir, cache_dir, use_numpy, test_input):
+    (inputs_dir / "test.txt").write_text(test_input)
+    with pytest.raises(ValueError):
+        puzzle_inputs.load_ints("test.txt", cache_dir=cache_dir)
+    assert not os.path.exists(cache_dir)
+
+
+def test_load_ints_reads_from_cache(inputs_dir, cache_dir, monkeypatch):
+    (inputs_dir / "test.txt").write_text("1,2,3")
+    puzzle_inputs.load_ints("test.txt", cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 1
+
+    def fail(text):
+        raise AssertionError("Input should not be parsed again")
+
+    monkeypatch.setattr(puzzle_inputs, "_parse_ints", fail)
+    assert puzzle_inputs.load_ints("test.txt", cache_dir=cache_dir) == [1, 2, 3]
+
+
+def test_load_ints_invalidates_cache_when_input_changes(inputs_dir, cache_dir):
+    (inputs_dir / "test.txt").write_text("1,2,3")
+    assert puzzle_inputs.load_ints("test.txt", cache_dir=cache_dir) == [1, 2, 3]
+    (inputs_dir / "test.txt").write_text("4,5")
+    assert puzzle_inputs.load_ints("test.txt", cache_dir=cache_dir) == [4, 5]
+
+
+def test_load_ints_does_not_cache_values_too_large_for_int64(inputs_dir, cache_dir):
+    (inputs_dir / "test.txt").write_text(f"1,{2 ** 70}")
+    assert puzzle_inputs.load_ints("test.txt", cache_dir=cache_dir) == [1, 2 ** 70]
+    assert not os.path.exists(cache_dir) or os.listdir(cache_dir) == []
+
+
+def test_load_ints_without_cache(inputs_dir, cache_dir):
+    (inputs_dir / "test.txt").write_text("1,2,3")
+    assert puzzle_inputs.load_ints("test.txt", cache_dir=None) == [1, 2, 3]
+    assert not os.path.exists(cache_dir)
+
+
+def test_load_wire_offsets(inputs_dir, cache_dir):
+    (inputs_dir / "wires.txt").write_text("R8,U5,L5,D3\nU7,R6,D4,L4\n")
+    expected = [
+        [(8, 0), (0, 5), (-5, 0), (0, -3)],
+        [(0, 7), (6, 0), (0, -4), (-4, 0)],
+    ]
+    assert puzzle_inputs.load_wire_offsets("wires.txt", cache_dir=cache_dir) == expected
+    assert puzzle_inputs.load_wire_offsets("wires.txt", cache_dir=cache_dir) == expected
+
+
+@pytest.mark.parametrize(
+    "test_input, expected", (
+            (b"1,0,0,3,99\n", [1, 0, 0, 3, 99]),
+            (b"12\n14\n1969\n", [12, 14, 1969]),
+            (b"-1, 2,\t-3", [-1, 2, -3]),
+            (b"", []),
+            (f"1,{2 ** 70},-3".encode(), [1, 2 ** 70, -3]),
+            (f"{2 ** 63},{2 ** 63 - 1}".encode(), [2 ** 63, 2 ** 63 - 1]),
+            (b"1,2\n3,4\n", [1, 2, 3, 4]),
+            (b"1 2  3", [1, 2, 3]),
+            (b"\n", []),
+            (b"  ", []),
+            (b"1,2\n,3", [1, 2, 3]),
+    )
+)
+def test_parse_ints(use_numpy, test_input, expected):
+    assert puzzle_inputs.parse_ints(test_input) == expected
+
+
+@pytest.mark.parametrize("test_input", (b"1,a,3", b"1,2.5", b"1,,2", b"1, ,2", b"1,2,\n", b",1", b","))
+def test_parse_ints_raises_exception_with_bad_input(use_numpy, test_input):
+    with pytest.raises(ValueError):
+        puzzle_inputs.parse_ints(test_input)
+
+
+def test_parse_ints_as_array():
+    numpy = pytest.importorskip("numpy")
+    values = puzzle_inputs.parse_ints(b"3,225,-1,225", as_array=True)
+    assert values.dtype == numpy.int64
+    assert values.tolist() == [3, 225, -1, 225]
+
+    with pytest.raises(ValueError):
+        puzzle_inputs.parse_ints(f"1,{2 ** 70}".encode(), as_array=True)
+
+
+@pytest.mark.parametrize("test_input", (b"", b"\n", b" \t "))
+def test_parse_ints_as_array_with_blank_input(test_input):
+    numpy = pytest.importorskip("numpy")
+    values = puzzle_inputs.parse_ints(test_input, as_array=True)
+    assert values.dtype == numpy.int64
+    assert values.tolist() == []
+
+
+@pytest.mark.parametrize("test_input", (2 ** 63 - 1, -2 ** 63))
+def test_parse_ints_as_array_accepts_int64_limits(test_input):
+    pytest.importorskip("numpy")
+    assert puzzle_inputs.parse_ints(f"{test_input},1".encode(), as_array=True).tolist() == [test_input, 1]
+
+
+@pytest.mark.parametrize("test_input", (2 ** 63, -2 ** 63 - 1))
+def test_parse_ints_as_array_raises_exception_beyond_int64_limits(test_input):
+    pytest.importorskip("numpy")
+    with pytest.raises(ValueError):
+        puzzle_inputs.parse_ints(f"{test_input},1".encode(), as_array=True)
+
+
+@pytest.mark.parametrize("test_input, expected", (("1,0,0,3,99\n", [1, 0, 0, 3, 99]), ("", [])))
+def test_load_program(inputs_dir, test_input, expected):
+    (inputs_dir / "program.txt").write_text(test_input)
+    assert puzzle_inputs.load_program("program.txt") == expected
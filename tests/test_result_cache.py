@@ -0,0 +1,121 @@
+import os
+from unittest import mock
+
+import pytest
+
+import result_cache
+import spacecraft
+
+# Outputs 999, 1000 or 1001 depending on whether its input is below, equal to or above 8
+COMPARISON_PROGRAM = [
+    3, 21, 1008, 21, 8, 20, 1005, 20, 22, 107, 8, 21, 20, 1006, 20, 31,
+    1106, 0, 36, 98, 0, 0, 1002, 21, 125, 20, 4, 20, 1105, 1, 46, 104,
+    999, 1105, 1, 46, 1101, 1000, 1, 20, 4, 20, 1105, 1, 46, 98, 99
+]
+
+
+@pytest.mark.parametrize("first, second", [
+    (([1, 0, 0, 0, 99], None, ()), ([1, 0, 0, 0, 99], None, (1,))),
+    (([1, 0, 0, 0, 99], None, ()), ([1, 0, 0, 1, 99], None, ())),
+    (([1, 0, 0, 0, 99], {1: 2}, ()), ([1, 0, 0, 0, 99], {1: 3}, ())),
+    (([1, 0, 0, 0, 99], None, (12,)), ([1, 0, 0, 0, 99], None, (1, 2))),
+])
+def test_result_key_distinguishes_program_patches_and_inputs(first, second):
+    assert result_cache.result_key(*first) != result_cache.result_key(*second)
+
+
+def test_result_key_ignores_patch_order():
+    program = [1, 0, 0, 0, 99]
+    assert result_cache.result_key(program, {1: 2, 2: 3}) == result_cache.result_key(program, {2: 3, 1: 2})
+
+
+def test_run_returns_cached_result_without_running_program():
+    cache = result_cache.ResultCache()
+    computer = spacecraft.Computer()
+    assert cache.run(computer, COMPARISON_PROGRAM, input_values=[8])[1] == [1000]
+
+    with mock.patch.object(computer, "intcode") as mock_intcode:
+        memory, outputs = cache.run(computer, COMPARISON_PROGRAM, input_values=[8])
+    mock_intcode.assert_not_called()
+    assert outputs == [1000]
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_run_applies_patches_to_a_copy():
+    program = [1, 0, 0, 0, 99]
+    memory, _ = result_cache.ResultCache().run(spacecraft.Computer(), program, patches={1: 4, 2: 4})
+    assert memory == [198, 4, 4, 0, 99]
+    assert program == [1, 0, 0, 0, 99]
+
+
+def test_cached_results_cannot_be_modified_by_callers():
+    cache = result_cache.ResultCache()
+    memory, outputs = cache.run(spacecraft.Computer(), COMPARISON_PROGRAM, input_values=[9])
+    memory[0] = -1
+    outputs.append(-1)
+    assert cache.run(spacecraft.Computer(), COMPARISON_PROGRAM, input_values=[9]) == (
+        spacecraft.Computer().intcode(COMPARISON_PROGRAM.copy(), input_values=[9], outputs=[]), [1001]
+    )
+
+
+def test_least_recently_used_entry_is_evicted_from_memory():
+    cache = result_cache.ResultCache(max_entries=2)
+    cache.put("a", [1], [])
+    cache.put("b", [2], [])
+    cache.get("a")
+    cache.put("c", [3], [])
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == ([1], [])
+
+
+def test_results_are_shared_through_disk(tmp_path):
+    result_cache.ResultCache(cache_dir=str(tmp_path)).run(spacecraft.Computer(), COMPARISON_PROGRAM, input_values=[7])
+
+    cache = result_cache.ResultCache(cache_dir=str(tmp_path))
+    computer = spacecraft.Computer()
+    with mock.patch.object(computer, "intcode") as mock_intcode:
+        _, outputs = cache.run(computer, COMPARISON_PROGRAM, input_values=[7])
+    mock_intcode.assert_not_called()
+    assert outputs == [999]
+
+
+def test_disk_store_evicts_least_recently_used_files(tmp_path):
+    cache = result_cache.ResultCache(cache_dir=str(tmp_path), max_disk_bytes=250)
+    for index, key in enumerate(["a", "b", "c"]):
+        cache.put(key, [0] * 40, [])
+        os.utime(tmp_path / f"{key}.json", (index, index))
+    cache.put("d", [0] * 40, [])
+    assert sorted(os.listdir(tmp_path)) == ["c.json", "d.json"]
+
+
+def test_invalid_max_entries_raises_exception():
+    with pytest.raises(ValueError):
+        result_cache.ResultCache(max_entries=0)
+
+
+class TestComputerCache:
+    def test_intcode_with_cache_updates_memory_and_outputs(self):
+        cache = result_cache.ResultCache()
+        computer = spacecraft.Computer()
+        computer.intcode(COMPARISON_PROGRAM.copy(), input_values=[8], outputs=[], cache=cache)
+
+        program = COMPARISON_PROGRAM.copy()
+        outputs = []
+        assert computer.intcode(program, input_values=[8], outputs=outputs, cache=cache) is program
+        assert program == spacecraft.Computer().intcode(COMPARISON_PROGRAM.copy(), input_values=[8], outputs=[])
+        assert outputs == [1000]
+        assert cache.hits == 1
+
+    @mock.patch("builtins.print")
+    def test_intcode_with_cache_prints_cached_outputs(self, mock_print):
+        cache = result_cache.ResultCache()
+        spacecraft.Computer().intcode(COMPARISON_PROGRAM.copy(), input_values=[3], cache=cache)
+        spacecraft.Computer().intcode(COMPARISON_PROGRAM.copy(), input_values=[3], cache=cache)
+        assert mock_print.call_args_list == [mock.call(999), mock.call(999)]
+        assert cache.hits == 1
+
+    def test_intcode_without_input_values_is_not_cached(self):
+        cache = result_cache.ResultCache()
+        spacecraft.Computer().intcode([1, 0, 0, 0, 99], cache=cache)
+        assert len(cache) == 0
@@ -0,0 +1,41 @@
+import pytest
+
+import day4
+import scanning
+
+
+def is_even(value):
+    return value % 2 == 0
+
+
+class TestScanRange:
+    @pytest.mark.parametrize("processes", (1, 2))
+    def test_can_count_matches(self, processes):
+        assert scanning.scan_range(
+            day4.password_meets_criteria, 183564, 200000, chunk_size=1000, processes=processes
+        ) == sum(1 for x in range(183564, 200000) if day4.password_meets_criteria(x))
+
+    @pytest.mark.parametrize("processes", (1, 2))
+    def test_can_collect_matches(self, processes):
+        assert scanning.scan_range(is_even, 3, 40, collect=True, chunk_size=7, processes=processes) == list(
+            range(4, 40, 2)
+        )
+
+    @pytest.mark.parametrize("processes", (1, 2))
+    def test_stops_early_at_limit(self, processes):
+        assert scanning.scan_range(is_even, 0, 10 ** 6, collect=True, limit=3, chunk_size=10,
+                                   processes=processes) == [0, 2, 4]
+        assert scanning.scan_range(is_even, 0, 10 ** 6, limit=3, chunk_size=10, processes=processes) == 3
+
+    def test_reports_progress(self):
+        calls = []
+        scanning.scan_range(is_even, 0, 25, chunk_size=10, processes=1, progress=lambda *args: calls.append(args))
+        assert calls == [(10, 25), (20, 25), (25, 25)]
+
+    def test_empty_range(self):
+        assert scanning.scan_range(is_even, 10, 10, processes=1) == 0
+
+    @pytest.mark.parametrize("kwargs", ({"processes": 0}, {"chunk_size": 0}, {"limit": 0}))
+    def test_raises_exception_with_bad_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            scanning.scan_range(is_even, 0, 10, **kwargs)
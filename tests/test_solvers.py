@@ -0,0 +1,29 @@
+from unittest import mock
+
+import pytest
+
+import solvers
+
+
+@pytest.mark.parametrize("day", sorted(solvers.DAYS))
+def test_can_load_each_day(day):
+    assert callable(solvers.load(day).main)
+
+
+@pytest.mark.parametrize("day, expected", ((4, ["part1", "part2"]), (5, ["part1", "part2"])))
+def test_parts(day, expected):
+    assert solvers.parts(day) == expected
+
+
+def test_run_single_part(monkeypatch):
+    mock_print = mock.MagicMock()
+    monkeypatch.setattr('builtins.print', mock_print)
+
+    solvers.run(4, 2)
+    mock_print.assert_called_once_with(1104)
+
+
+@pytest.mark.parametrize("day, part", ((99, None), (4, 3)))
+def test_solver_raises_exception_with_unknown_day_or_part(day, part):
+    with pytest.raises(ValueError):
+        solvers.solver(day, part)
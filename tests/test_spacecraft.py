@@ -104,3 +104,90 @@ class TestComputer(object):
     )
     def test_intcode_can_interpret_param_modes(self, test_input, expected, fixture_computer):
         assert fixture_computer.intcode(test_input) == expected
+
+
+class TestModuleAssembly(object):
+    @pytest.fixture()
+    def fixture_assembly(self):
+        leaf1 = spacecraft.Module(12)
+        leaf2 = spacecraft.Module(1969)
+        sub_assembly = spacecraft.Module(14, modules=[leaf2])
+        root = spacecraft.Module(100756, modules=[leaf1, sub_assembly])
+        return root, sub_assembly, leaf1, leaf2
+
+    def test_total_mass(self, fixture_assembly):
+        root, sub_assembly, leaf1, leaf2 = fixture_assembly
+        assert root.total_mass == 100756 + 12 + 14 + 1969
+        assert sub_assembly.total_mass == 14 + 1969
+
+    def test_total_fuel_requirement(self, fixture_assembly):
+        root = fixture_assembly[0]
+        assert root.total_fuel_requirement == 50346 + 2 + 2 + 966
+
+    def test_massless_assembly_requires_no_fuel_of_its_own(self):
+        assembly = spacecraft.Module(modules=[spacecraft.Module(14), spacecraft.Module(1969)])
+        assert assembly.total_fuel_requirement == 2 + 966
+
+    def test_leaf_change_invalidates_path_to_root_only(self, fixture_assembly):
+        root, sub_assembly, leaf1, leaf2 = fixture_assembly
+        ship = spacecraft.Spacecraft(modules=[root])
+        assert ship.mass == 100756 + 12 + 14 + 1969
+
+        leaf2.mass = 100756
+        assert sub_assembly._total_mass is None
+        assert root._total_mass is None
+        assert leaf1._total_mass == 12
+        assert ship.mass == 100756 + 12 + 14 + 100756
+        assert ship.fuel_requirement == 50346 + 2 + 2 + 50346
+
+    def test_add_module_moves_module_between_assemblies(self, fixture_assembly):
+        root, sub_assembly, leaf1, leaf2 = fixture_assembly
+        sub_assembly.add_module(leaf1)
+        assert leaf1.parent is sub_assembly
+        assert leaf1 not in root.modules
+        assert root.total_mass == 100756 + 12 + 14 + 1969
+        assert sub_assembly.total_mass == 12 + 14 + 1969
+
+    def test_remove_module(self, fixture_assembly):
+        root, sub_assembly, leaf1, leaf2 = fixture_assembly
+        assert root.total_mass == 100756 + 12 + 14 + 1969
+        root.remove_module(sub_assembly)
+        assert sub_assembly.parent is None
+        assert root.total_mass == 100756 + 12
+
+    def test_add_module_raises_exception_with_cycle(self, fixture_assembly):
+        root, sub_assembly, leaf1, leaf2 = fixture_assembly
+        with pytest.raises(ValueError):
+            leaf2.add_module(root)
+
+    def test_add_module_raises_exception_with_bad_input(self, fixture_assembly):
+        with pytest.raises(TypeError):
+            fixture_assembly[0].add_module(12)
+
+
+class TestComputerIO(object):
+    def test_intcode_can_take_input_values_and_collect_outputs(self):
+        outputs = []
+        program = [3, 9, 8, 9, 10, 9, 4, 9, 99, -1, 8]
+        spacecraft.Computer().intcode(program, input_values=[8], outputs=outputs)
+        assert outputs == [1]
+
+    def test_intcode_raises_exception_when_input_values_exhausted(self):
+        with pytest.raises(RuntimeError):
+            spacecraft.Computer().intcode([3, 0, 3, 0, 99], input_values=[1])
+
+    def test_execute_can_pause_and_resume(self):
+        computer = spacecraft.Computer()
+        program = [3, 9, 1, 9, 9, 9, 4, 9, 99, 0]
+        outputs = []
+
+        index, steps, halted = computer.execute(program, input_values=iter([]), outputs=outputs, wait_for_input=True)
+        assert (index, steps, halted) == (0, 0, False)
+
+        index, steps, halted = computer.execute(program, index=index, input_values=iter([21]), outputs=outputs,
+                                                max_steps=2)
+        assert (index, steps, halted) == (6, 2, False)
+
+        index, steps, halted = computer.execute(program, index=index, outputs=outputs)
+        assert halted
+        assert outputs == [42]
@@ -1,3 +1,5 @@
+import sys
+
 import pytest
 
 import systems
@@ -9,7 +11,8 @@ class TestWire:
                 (None, [(0, 0)]),
                 ("U42", [(0, 0), (0, 42)]),
                 ("D29,R39", [(0, 0), (0, -29), (39, -29)]),
-                (["D29", "R39"], [(0, 0), (0, -29), (39, -29)])
+                (["D29", "R39"], [(0, 0), (0, -29), (39, -29)]),
+                ([(0, -29), (39, 0)], [(0, 0), (0, -29), (39, -29)])
         )
     )
     def test_init(self, test_input, expected):
@@ -76,6 +79,36 @@ class TestWire:
 
         assert ret_val == expected
 
+    @pytest.mark.parametrize(
+        "test_input, expected", (
+                ("R5,R3", [(0, 0), (8, 0)]),
+                ("R5,R0,R3,U2", [(0, 0), (8, 0), (8, 2)]),
+                ("U0", [(0, 0)]),
+                ("R5,L3", [(0, 0), (5, 0), (2, 0)]),
+                ("D1,D2,L4,L1,D3", [(0, 0), (0, -3), (-5, -3), (-5, -6)])
+        )
+    )
+    def test_normalize_merges_collinear_moves_and_drops_zero_length_moves(self, test_input, expected):
+        wire = systems.Wire(test_input, normalize=True)
+        assert wire.points == expected
+
+    def test_zero_length_move_raises_exception_without_normalize(self):
+        with pytest.raises(ValueError):
+            systems.Wire("R0")
+
+    @pytest.mark.parametrize("test_point", ((3, 0), (7, 0), (7, 2), (4, 2), (4, 4)))
+    def test_normalize_keeps_distance_to_point(self, test_point):
+        instructions = "R3,R4,U1,U1,L3,U2"
+        assert (systems.Wire(instructions, normalize=True).distance_to_point(test_point)
+                == systems.Wire(instructions).distance_to_point(test_point))
+
+    def test_normalized_returns_new_normalized_wire(self):
+        wire = systems.Wire("U1,U2,R3,L1")
+        normalized = wire.normalized()
+        assert normalized is not wire
+        assert normalized.points == [(0, 0), (0, 3), (3, 3), (2, 3)]
+        assert len(wire.segments) == 4
+
 
 class TestWireSegment:
     def test_init(self):
@@ -201,6 +234,17 @@ class TestFuelManagement:
             ]
         )
 
+    def test_can_add_normalized_wire_by_instructions(self, fm):
+        fm.add_wire("U40,U2,L400", normalize=True)
+        self.check_wire_points(
+            fm.wires[0],
+            [
+                (0, 0),
+                (0, 42),
+                (-400, 42)
+            ]
+        )
+
     def test_add_wire_raises_exception_with_bad_instructions(self, fm):
         with pytest.raises(TypeError):
             fm.add_wire({})
@@ -247,3 +291,37 @@ class TestFuelManagement:
 
         assert fm.get_lowest_latency_intersection() == expected
 
+    def test_step_distances(self, fm):
+        pytest.importorskip("numpy")
+        fm.add_wire("R8,U5,L5,D3")
+        fm.add_wire("U7,R6,D4,L4")
+        assert fm.step_distances([(3, 3), (6, 5), (1, 1)]).tolist() == [[20, 15, -1], [20, 15, -1]]
+
+    @pytest.mark.parametrize("use_numpy", (True, False))
+    def test_lowest_latency_intersection_with_and_without_numpy(self, fm, monkeypatch, use_numpy):
+        if use_numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setitem(sys.modules, "numpy", None)
+        fm.add_wire("R75,D30,R83,U83,L12,D49,R71,U7,L72")
+        fm.add_wire("U62,R66,U55,R34,D71,R55,D58,R83")
+        assert fm.get_lowest_latency_intersection() == 610
+
+    @pytest.mark.parametrize("use_numpy", (True, False))
+    @pytest.mark.parametrize(
+        "test_wires, expected", (
+                (("U1,R2", "R1,U2", "D5"), None),
+                (("U1,R2", "R1,U2", "U1,R1"), 6)
+        )
+    )
+    def test_lowest_latency_intersection_skips_points_some_wire_misses(
+            self, fm, monkeypatch, use_numpy, test_wires, expected
+    ):
+        if use_numpy:
+            pytest.importorskip("numpy")
+        else:
+            monkeypatch.setitem(sys.modules, "numpy", None)
+        for test_wire in test_wires:
+            fm.add_wire(test_wire)
+
+        assert fm.get_lowest_latency_intersection() == expected
@@ -0,0 +1,115 @@
+import itertools
+
+import pytest
+
+import systems
+import wire_index
+
+SPIRAL = "R8,U5,L5,D3,R2,U1,L10,D7,R20,U12,L14,D2,R3"
+
+
+@pytest.fixture(params=[1, 2, 8])
+def index(request):
+    return wire_index.SegmentIndex(systems.Wire(SPIRAL).segments, leaf_size=request.param)
+
+
+def brute_force_touching(segments, region):
+    x_min, x_max = sorted((region[0], region[2]))
+    y_min, y_max = sorted((region[1], region[3]))
+    return [
+        segment for segment in segments
+        if min(segment.start.x, segment.end.x) <= x_max and x_min <= max(segment.start.x, segment.end.x)
+        and min(segment.start.y, segment.end.y) <= y_max and y_min <= max(segment.start.y, segment.end.y)
+    ]
+
+
+@pytest.mark.parametrize("region", [(0, 0, 1, 1), (-3, -3, 2, 2), (5, 5, -5, -5), (100, 100, 200, 200), (8, 5, 8, 5)])
+def test_segments_in_matches_brute_force(index, region):
+    assert index.segments_in(region) == brute_force_touching(index.segments, region)
+
+
+@pytest.mark.parametrize("region, expected", [
+    ((3, -1, 4, 1), 0),
+    ((8, 3, 9, 3), 1),
+    ((-2, 3, -2, 3), 6),
+    ((100, 100, 101, 101), None),
+])
+def test_first_touching_returns_earliest_segment(index, region, expected):
+    assert index.first_touching(region) == expected
+
+
+@pytest.mark.parametrize("point, expected", [((8, 2), True), ((3, 0), True), ((1, 1), False), ((-50, 0), False)])
+def test_passes_through(index, point, expected):
+    assert index.passes_through(point) is expected
+
+
+def test_distance_to_point_matches_walking_the_wire(index):
+    wire = systems.Wire(SPIRAL)
+    for point in [(0, 0), (8, 2), (3, 5), (5, 3), (-5, -2), (14, 8)]:
+        expected = None
+        total_length = 0
+        for segment in wire.segments:
+            if segment.intersects_point(point):
+                expected = total_length + abs(point[0] - segment.start.x) + abs(point[1] - segment.start.y)
+                break
+            total_length += segment.length
+        assert index.distance_to_point(point) == expected
+    assert index.distance_to_point((1, 1)) is None
+
+
+def test_candidate_pairs_include_every_intersecting_pair(index):
+    other = wire_index.SegmentIndex(systems.Wire("U3,R12,D9,L6,U20").segments, leaf_size=3)
+    candidates = set(index.candidate_pairs(other))
+    for segment, other_segment in itertools.product(index.segments, other.segments):
+        if segment.intersects_at(other_segment) is not None:
+            assert (segment, other_segment) in candidates
+    assert len(candidates) < len(index.segments) * len(other.segments)
+
+
+def test_empty_index():
+    index = wire_index.SegmentIndex([])
+    assert index.segments_in((0, 0, 10, 10)) == []
+    assert index.distance_to_point((0, 0)) is None
+    assert list(index.candidate_pairs(wire_index.SegmentIndex(systems.Wire("R1").segments))) == []
+
+
+def test_invalid_leaf_size_raises_exception():
+    with pytest.raises(ValueError):
+        wire_index.SegmentIndex([], leaf_size=0)
+
+
+def test_wire_index_is_rebuilt_after_adding_segment():
+    wire = systems.Wire("R5")
+    assert not wire.index.passes_through((5, 3))
+    wire.add_segment("U4")
+    assert wire.index.passes_through((5, 3))
+    assert wire.distance_to_point((5, 3)) == 8
+
+
+@pytest.mark.parametrize("instructions", [SPIRAL, "R10,L4,R8,U3,D6,U3,L20", "U5,D5,U5,R1,L1,D2"])
+def test_distances_to_points_matches_distance_to_point(instructions):
+    np = pytest.importorskip("numpy")
+    index = wire_index.SegmentIndex(systems.Wire(instructions).segments)
+    points = [(x, y) for x in range(-12, 17) for y in range(-6, 10)]
+    expected = [index.distance_to_point(point) for point in points]
+
+    distances = index.distances_to_points(np.array(points))
+    assert distances.tolist() == [-1 if distance is None else distance for distance in expected]
+
+
+def test_distances_to_points_with_empty_inputs():
+    pytest.importorskip("numpy")
+    assert wire_index.SegmentIndex([]).distances_to_points([(0, 0)]).tolist() == [-1]
+    assert wire_index.SegmentIndex(systems.Wire("R1").segments).distances_to_points([]).tolist() == []
+
+
+@pytest.mark.parametrize("mutate, point, expected", [
+    (lambda segments: segments.append(systems.WireSegment((5, 5), (0, 5))), (2, 5), 13),
+    (lambda segments: segments.__setitem__(1, systems.WireSegment((5, 0), (5, 8))), (5, 7), 12),
+    (lambda segments: segments.__delitem__(1), (5, 3), None),
+])
+def test_wire_index_is_rebuilt_after_segments_are_modified_directly(mutate, point, expected):
+    wire = systems.Wire("R5,U5")
+    assert wire.distance_to_point((5, 3)) == 8
+    mutate(wire.segments)
+    assert wire.distance_to_point(point) == expected